@@ -12,8 +12,9 @@ Cleanup includes:
 """
 
 import subprocess
-import time
-from typing import Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from typing import Any, Iterator, Optional
 
 try:
     import boto3
@@ -22,6 +23,112 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
+from utils import KUBERNETES_AVAILABLE, forget_pod, get_core_v1
+
+if KUBERNETES_AVAILABLE:
+    from kubernetes import watch as k8s_watch
+
+# Keys per DeleteObjects request (S3 allows up to 1000)
+S3_DELETE_BATCH_SIZE = 500
+
+# DeleteObjects requests in flight per prefix
+S3_DELETE_CONCURRENCY = 8
+
+# S3 clients reused across cleanup calls, keyed by connection settings
+_S3_CLIENTS: dict[tuple, Any] = {}
+
+
+def _get_s3_client(endpoint: str, access_key: str, secret_key: str, verify_ssl: bool):
+    """Return a cached boto3 S3 client for the given connection settings.
+    
+    Building a client resolves credentials and sets up a fresh connection
+    pool, so repeated full_cleanup calls share one client per endpoint.
+    """
+    key = (endpoint, access_key, secret_key, verify_ssl)
+    client = _S3_CLIENTS.get(key)
+    if client is None:
+        # Configure boto3 for S3-compatible storage
+        boto_config = BotoConfig(
+            signature_version='s3v4',
+            s3={'addressing_style': 'path'},
+            max_pool_connections=32,
+            retries={'max_attempts': 3, 'mode': 'standard'},
+        )
+        
+        client = boto3.client(
+            's3',
+            endpoint_url=endpoint,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            verify=verify_ssl,
+            config=boto_config,
+        )
+        _S3_CLIENTS[key] = client
+    return client
+
+
+def _iter_s3_keys(s3, bucket: str, prefix: str) -> Iterator[str]:
+    """Yield every object key under an S3 prefix, page by page."""
+    paginator = s3.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        yield from (obj['Key'] for obj in page.get('Contents', ()))
+
+
+def _delete_s3_batch(s3, bucket: str, prefix: str, batch: list[dict]) -> tuple[int, list[str]]:
+    """Delete one batch of objects with a single DeleteObjects request.
+    
+    Returns:
+        Tuple of (files deleted, error messages)
+    """
+    try:
+        response = s3.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': batch, 'Quiet': True},
+        )
+    except Exception as e:
+        return 0, [f"Failed to delete {len(batch)} objects under {prefix}: {e}"]
+    # Quiet mode only reports the keys that failed
+    failed = response.get('Errors', [])
+    return len(batch) - len(failed), [
+        f"Failed to delete {err.get('Key')}: {err.get('Message')}"
+        for err in failed
+    ]
+
+
+def _clean_s3_prefix(s3, bucket: str, prefix: str) -> tuple[int, list[str]]:
+    """Delete every object under one S3 prefix.
+    
+    Batches are deleted while listing continues, with at most
+    S3_DELETE_CONCURRENCY requests in flight.
+    
+    Returns:
+        Tuple of (files deleted, error messages)
+    """
+    files_deleted = 0
+    errors = []
+    
+    def collect(done):
+        nonlocal files_deleted
+        for future in done:
+            deleted, batch_errors = future.result()
+            files_deleted += deleted
+            errors.extend(batch_errors)
+    
+    with ThreadPoolExecutor(max_workers=S3_DELETE_CONCURRENCY) as executor:
+        pending = set()
+        try:
+            keys = _iter_s3_keys(s3, bucket, prefix)
+            while batch := [{'Key': key} for key in islice(keys, S3_DELETE_BATCH_SIZE)]:
+                if len(pending) >= S3_DELETE_CONCURRENCY:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(_delete_s3_batch, s3, bucket, prefix, batch))
+        except Exception as e:
+            errors.append(f"Failed to list {prefix}: {e}")
+        collect(wait(pending).done)
+    
+    return files_deleted, errors
+
 
 def cleanup_s3_data(
     endpoint: str,
@@ -34,6 +141,9 @@ def cleanup_s3_data(
 ) -> dict:
     """Clean up S3 data files from previous test runs.
     
+    The prefixes are disjoint, so each one is listed and deleted in its
+    own thread.
+    
     Args:
         endpoint: S3 endpoint URL
         access_key: S3 access key
@@ -53,20 +163,7 @@ def cleanup_s3_data(
     errors = []
     
     try:
-        # Configure boto3 for S3-compatible storage
-        boto_config = BotoConfig(
-            signature_version='s3v4',
-            s3={'addressing_style': 'path'},
-        )
-        
-        s3 = boto3.client(
-            's3',
-            endpoint_url=endpoint,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            verify=verify_ssl,
-            config=boto_config,
-        )
+        s3 = _get_s3_client(endpoint, access_key, secret_key, verify_ssl)
         
         # Prefixes to clean up
         prefixes = [
@@ -81,21 +178,14 @@ def cleanup_s3_data(
                 f'data/csv/{org_id}/OCP/{cluster_id}/',
             ]
         
-        for prefix in prefixes:
-            try:
-                paginator = s3.get_paginator('list_objects_v2')
-                pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
-                
-                for page in pages:
-                    if 'Contents' in page:
-                        for obj in page['Contents']:
-                            try:
-                                s3.delete_object(Bucket=bucket, Key=obj['Key'])
-                                files_deleted += 1
-                            except Exception as e:
-                                errors.append(f"Failed to delete {obj['Key']}: {e}")
-            except Exception as e:
-                errors.append(f"Failed to list {prefix}: {e}")
+        # boto3 clients are safe to share between threads
+        with ThreadPoolExecutor(max_workers=len(prefixes)) as executor:
+            results = executor.map(
+                lambda prefix: _clean_s3_prefix(s3, bucket, prefix), prefixes
+            )
+            for deleted, prefix_errors in results:
+                files_deleted += deleted
+                errors.extend(prefix_errors)
         
         return {
             "files_deleted": files_deleted,
@@ -132,66 +222,74 @@ def cleanup_database_records(
     records_deleted = 0
     errors = []
     
-    # Build WHERE clause for cluster_id (stored in manifest as text)
-    cluster_filter = ""
-    if cluster_id:
-        cluster_filter = f"AND cluster_id = '{cluster_id}'"
+    # org_id/cluster_id are bound as psql variables (:'name' quotes them as
+    # literals); an empty cluster_id disables the cluster filter
+    cluster_filter = "(:'cluster_id' = '' OR m.cluster_id = :'cluster_id')"
     
     # Queries to clean up processing records
     # Note: Koku uses UUIDs for provider_id and customer_id, so we need proper joins
     cleanup_queries = [
         # Clean up report status records for this org
         f"""
-        DELETE FROM reporting_common_costusagereportstatus
-        WHERE manifest_id IN (
-            SELECT m.id FROM reporting_common_costusagereportmanifest m
-            JOIN api_provider p ON m.provider_id = p.uuid
-            JOIN api_customer c ON p.customer_id = c.id
-            WHERE c.org_id = '{org_id}'
-            {cluster_filter}
+        WITH deleted AS (
+            DELETE FROM reporting_common_costusagereportstatus s
+            USING reporting_common_costusagereportmanifest m, api_provider p, api_customer c
+            WHERE s.manifest_id = m.id
+              AND m.provider_id = p.uuid
+              AND p.customer_id = c.id
+              AND c.org_id = :'org_id'
+              AND {cluster_filter}
+            RETURNING 1
         )
+        SELECT COUNT(*) FROM deleted
         """,
         # Clean up manifest records for this org
         f"""
-        DELETE FROM reporting_common_costusagereportmanifest
-        WHERE provider_id IN (
-            SELECT p.uuid FROM api_provider p
-            JOIN api_customer c ON p.customer_id = c.id
-            WHERE c.org_id = '{org_id}'
+        WITH deleted AS (
+            DELETE FROM reporting_common_costusagereportmanifest m
+            USING api_provider p, api_customer c
+            WHERE m.provider_id = p.uuid
+              AND p.customer_id = c.id
+              AND c.org_id = :'org_id'
+              AND {cluster_filter}
+            RETURNING 1
         )
-        {cluster_filter}
+        SELECT COUNT(*) FROM deleted
         """,
     ]
     
-    for query in cleanup_queries:
-        try:
-            # Execute via psql in the database pod
-            result = subprocess.run(
-                [
-                    "oc", "exec", "-n", namespace, db_pod, "--",
-                    "psql", "-U", "koku_user", "-d", "costonprem_koku", "-t", "-c", query
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+    # Stream all deletes to one psql session over stdin inside a single
+    # transaction: one oc exec regardless of how many queries are added,
+    # and status rows are never removed without their manifests (or vice versa)
+    script = "".join(f"{query.strip()};\n" for query in cleanup_queries)
+    
+    try:
+        result = subprocess.run(
+            [
+                "oc", "exec", "-i", "-n", namespace, db_pod, "--",
+                "psql", "-U", "koku_user", "-d", "costonprem_koku",
+                "-X", "-q", "-A", "-t",
+                "-v", "ON_ERROR_STOP=1", "--single-transaction",
+                "-v", f"org_id={org_id}",
+                "-v", f"cluster_id={cluster_id or ''}",
+                "-f", "-",
+            ],
+            input=script,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        
+        if result.returncode == 0:
+            # Each statement prints only its deleted-row count
+            records_deleted = sum(int(line) for line in result.stdout.split())
+        else:
+            errors.append(f"Query failed: {result.stderr}")
             
-            if result.returncode == 0:
-                # Try to parse deleted count from output
-                output = result.stdout.strip()
-                if output.startswith("DELETE"):
-                    try:
-                        count = int(output.split()[1])
-                        records_deleted += count
-                    except (IndexError, ValueError):
-                        pass
-            else:
-                errors.append(f"Query failed: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            errors.append("Query timed out")
-        except Exception as e:
-            errors.append(str(e))
+    except subprocess.TimeoutExpired:
+        errors.append("Query timed out")
+    except Exception as e:
+        errors.append(str(e))
     
     return {
         "records_deleted": records_deleted,
@@ -199,49 +297,38 @@ def cleanup_database_records(
     }
 
 
-def restart_valkey(namespace: str, timeout: int = 120) -> dict:
-    """Restart Valkey to clear cached processing state.
+def _restart_pods(namespace: str, selector: str, timeout: int) -> bool:
+    """Delete the pods matching a selector and wait for a replacement to be ready.
+    
+    Uses the Kubernetes API (delete collection + pod watch) when the client
+    is available, avoiding an oc process per step; falls back to oc
+    otherwise.
     
-    Args:
-        namespace: Kubernetes namespace
-        timeout: Timeout in seconds to wait for pod to be ready
-        
     Returns:
-        Dict with restart status
+        True if a replacement pod became ready within the timeout
     """
-    try:
-        # Delete Valkey pod (will be recreated by deployment)
-        result = subprocess.run(
+    forget_pod(namespace, selector)
+    core = get_core_v1()
+    
+    if core is None:
+        # Delete the pod (recreated by its deployment) and wait for it to go
+        subprocess.run(
             [
                 "oc", "delete", "pod", "-n", namespace,
-                "-l", "app.kubernetes.io/component=cache",
-                "--wait=false"
+                "-l", selector,
+                f"--timeout={timeout}s"
             ],
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=timeout + 10,
         )
         
-        if result.returncode != 0:
-            # Try alternative label
-            result = subprocess.run(
-                [
-                    "oc", "delete", "pod", "-n", namespace,
-                    "-l", "app.kubernetes.io/component=cache",
-                    "--wait=false"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-        
-        # Wait for pod to be ready
-        time.sleep(5)  # Brief pause before checking
-        
+        # The delete blocks until the old pod is gone, by which point the
+        # replacement exists, so oc wait watches the new pod directly
         result = subprocess.run(
             [
                 "oc", "wait", "--for=condition=ready", "pod",
-                "-l", "app.kubernetes.io/component=cache",
+                "-l", selector,
                 "-n", namespace,
                 f"--timeout={timeout}s"
             ],
@@ -249,23 +336,52 @@ def restart_valkey(namespace: str, timeout: int = 120) -> dict:
             text=True,
             timeout=timeout + 10,
         )
+        return result.returncode == 0
+    
+    old_pods = {
+        pod.metadata.uid
+        for pod in core.list_namespaced_pod(namespace, label_selector=selector).items
+    }
+    if not old_pods:
+        # Nothing to restart; don't wait out the timeout for a replacement
+        return False
+    core.delete_collection_namespaced_pod(
+        namespace, label_selector=selector, propagation_policy="Background"
+    )
+    
+    # React to pod events instead of polling; the first Ready pod that is
+    # not one of the deleted ones is the replacement
+    watcher = k8s_watch.Watch()
+    for event in watcher.stream(
+        core.list_namespaced_pod,
+        namespace=namespace,
+        label_selector=selector,
+        timeout_seconds=timeout,
+    ):
+        pod = event["object"]
+        if pod.metadata.uid in old_pods or pod.metadata.deletion_timestamp:
+            continue
+        if any(
+            c.type == "Ready" and c.status == "True"
+            for c in pod.status.conditions or []
+        ):
+            watcher.stop()
+            return True
+    return False
+
+
+def restart_valkey(namespace: str, timeout: int = 120) -> dict:
+    """Restart Valkey to clear cached processing state.
+    
+    Args:
+        namespace: Kubernetes namespace
+        timeout: Timeout in seconds to wait for pod to be ready
         
-        if result.returncode != 0:
-            # Try alternative label
-            result = subprocess.run(
-                [
-                    "oc", "wait", "--for=condition=ready", "pod",
-                    "-l", "app.kubernetes.io/component=cache",
-                    "-n", namespace,
-                    f"--timeout={timeout}s"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=timeout + 10,
-            )
-        
-        return {"success": result.returncode == 0}
-        
+    Returns:
+        Dict with restart status
+    """
+    try:
+        return {"success": _restart_pods(namespace, "app.kubernetes.io/component=cache", timeout)}
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "Timeout waiting for Valkey"}
     except Exception as e:
@@ -283,35 +399,7 @@ def restart_koku_listener(namespace: str, timeout: int = 180) -> dict:
         Dict with restart status
     """
     try:
-        # Delete listener pod
-        result = subprocess.run(
-            [
-                "oc", "delete", "pod", "-n", namespace,
-                "-l", "app.kubernetes.io/component=listener",
-                "--wait=false"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        
-        # Wait for pod to be ready
-        time.sleep(10)  # Brief pause before checking
-        
-        result = subprocess.run(
-            [
-                "oc", "wait", "--for=condition=ready", "pod",
-                "-l", "app.kubernetes.io/component=listener",
-                "-n", namespace,
-                f"--timeout={timeout}s"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeout + 10,
-        )
-        
-        return {"success": result.returncode == 0}
-        
+        return {"success": _restart_pods(namespace, "app.kubernetes.io/component=listener", timeout)}
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "Timeout waiting for listener"}
     except Exception as e:
@@ -346,11 +434,11 @@ def full_cleanup(
     if verbose:
         print("\n🧹 Cleaning up test artifacts...")
     
-    # Clean up S3 data
+    # The steps touch independent state, so they run concurrently and
+    # total time is roughly that of the slowest step
+    steps = {}
     if s3_config:
-        if verbose:
-            print("  📦 Cleaning S3 data files...")
-        s3_result = cleanup_s3_data(
+        steps["s3"] = ("📦 Cleaning S3 data files", lambda: cleanup_s3_data(
             endpoint=s3_config["endpoint"],
             access_key=s3_config["access_key"],
             secret_key=s3_config["secret_key"],
@@ -358,53 +446,57 @@ def full_cleanup(
             org_id=org_id,
             cluster_id=cluster_id,
             verify_ssl=s3_config.get("verify_ssl", False),
-        )
-        results["s3"] = s3_result
-        if verbose:
-            if s3_result.get("files_deleted", 0) > 0:
-                print(f"     ✅ Deleted {s3_result['files_deleted']} S3 files")
-            elif s3_result.get("error"):
-                print(f"     ⚠️  S3 cleanup error: {s3_result['error']}")
-    
-    # Clean up database records
-    if verbose:
-        print("  🗄️  Cleaning database records...")
-    db_result = cleanup_database_records(
+        ))
+    steps["database"] = ("🗄️  Cleaning database records", lambda: cleanup_database_records(
         namespace=namespace,
         db_pod=db_pod,
         org_id=org_id,
         cluster_id=cluster_id,
-    )
-    results["database"] = db_result
-    if verbose:
-        if db_result.get("records_deleted", 0) > 0:
-            print(f"     ✅ Deleted {db_result['records_deleted']} database records")
-        elif db_result.get("errors"):
-            print(f"     ⚠️  Database cleanup errors: {db_result['errors']}")
-    
+    ))
     # Optionally restart services
     if restart_services:
-        if verbose:
-            print("  🔄 Restarting Valkey...")
-        valkey_result = restart_valkey(namespace)
-        results["valkey"] = valkey_result
-        if verbose:
-            if valkey_result.get("success"):
-                print("     ✅ Valkey restarted")
-            else:
-                print(f"     ⚠️  Valkey restart failed: {valkey_result.get('error')}")
+        steps["valkey"] = ("🔄 Restarting Valkey", lambda: restart_valkey(namespace))
+        steps["listener"] = ("🔄 Restarting Koku listener", lambda: restart_koku_listener(namespace))
+    
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = {}
+        for name, (label, step) in steps.items():
+            if verbose:
+                print(f"  {label}...")
+            futures[executor.submit(step)] = name
         
-        if verbose:
-            print("  🔄 Restarting Koku listener...")
-        listener_result = restart_koku_listener(namespace)
-        results["listener"] = listener_result
-        if verbose:
-            if listener_result.get("success"):
-                print("     ✅ Listener restarted")
-            else:
-                print(f"     ⚠️  Listener restart failed: {listener_result.get('error')}")
+        # Report each step as it finishes
+        for future in as_completed(futures):
+            name = futures[future]
+            result = results[name] = future.result()
+            if verbose:
+                _print_step_result(name, result)
     
     if verbose:
         print("  ✅ Cleanup complete\n")
     
     return results
+
+
+def _print_step_result(name: str, result: dict) -> None:
+    """Print the outcome of one full_cleanup step."""
+    if name == "s3":
+        if result.get("files_deleted", 0) > 0:
+            print(f"     ✅ Deleted {result['files_deleted']} S3 files")
+        elif result.get("error"):
+            print(f"     ⚠️  S3 cleanup error: {result['error']}")
+    elif name == "database":
+        if result.get("records_deleted", 0) > 0:
+            print(f"     ✅ Deleted {result['records_deleted']} database records")
+        elif result.get("errors"):
+            print(f"     ⚠️  Database cleanup errors: {result['errors']}")
+    elif name == "valkey":
+        if result.get("success"):
+            print("     ✅ Valkey restarted")
+        else:
+            print(f"     ⚠️  Valkey restart failed: {result.get('error')}")
+    elif name == "listener":
+        if result.get("success"):
+            print("     ✅ Listener restarted")
+        else:
+            print(f"     ⚠️  Listener restart failed: {result.get('error')}")
@@ -6,16 +6,19 @@ Suite-specific fixtures are defined in each suite's conftest.py.
 """
 
 import os
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from typing import Optional
 
 import pytest
 import requests
 import urllib3
 
+from e2e_helpers import get_koku_api_url
 from utils import get_route_url, get_secret_value, run_oc_command
 
 # Import shared fixtures from test suites
@@ -26,6 +29,18 @@ pytest_plugins = ["suites.cost_management.conftest", "suites.sources.conftest"]
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+def pytest_addoption(parser):
+    """Register command-line options shared by the test suites."""
+    parser.addoption(
+        "--reuse-cluster-id",
+        default=os.environ.get("E2E_REUSE_CLUSTER_ID"),
+        help=(
+            "Run cost validation against data already processed for this cluster ID "
+            "instead of generating and uploading new data (env: E2E_REUSE_CLUSTER_ID)"
+        ),
+    )
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -41,6 +56,11 @@ class ClusterConfig:
     platform: str = "openshift"
     project_root: str = field(default_factory=lambda: os.path.dirname(os.path.dirname(__file__)))
 
+    @cached_property
+    def koku_api_url(self) -> str:
+        """Internal Koku API URL for this release (reads and writes)."""
+        return get_koku_api_url(self.helm_release_name, self.namespace)
+
 
 @dataclass
 class KeycloakConfig:
@@ -156,6 +176,10 @@ def keycloak_config(cluster_config: ClusterConfig) -> KeycloakConfig:
     )
 
 
+# Keep-alive session for token requests so refreshes reuse the TLS connection
+_TOKEN_SESSION = requests.Session()
+
+
 def obtain_jwt_token(keycloak_config: KeycloakConfig) -> JWTToken:
     """Obtain a fresh JWT token from Keycloak using client credentials flow.
     
@@ -172,7 +196,7 @@ def obtain_jwt_token(keycloak_config: KeycloakConfig) -> JWTToken:
     Raises:
         pytest.fail: If token request fails
     """
-    response = requests.post(
+    response = _TOKEN_SESSION.post(
         keycloak_config.token_url,
         data={
             "grant_type": "client_credentials",
@@ -196,19 +220,44 @@ def obtain_jwt_token(keycloak_config: KeycloakConfig) -> JWTToken:
     )
 
 
+class JWTTokenProvider:
+    """Hands out a cached JWT token, refreshing it shortly before expiry."""
+
+    def __init__(self, keycloak_config: KeycloakConfig, min_validity: int = 120):
+        self.keycloak_config = keycloak_config
+        self.min_validity = timedelta(seconds=min_validity)
+        self._token: Optional[JWTToken] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> JWTToken:
+        """Return a token valid for at least min_validity seconds."""
+        with self._lock:
+            if (
+                self._token is None
+                or datetime.now(timezone.utc) + self.min_validity >= self._token.expires_at
+            ):
+                self._token = obtain_jwt_token(self.keycloak_config)
+            return self._token
+
+
+@pytest.fixture(scope="session")
+def jwt_token_provider(keycloak_config: KeycloakConfig) -> JWTTokenProvider:
+    """Session-wide JWT token cache shared by the jwt_token fixture."""
+    return JWTTokenProvider(keycloak_config)
+
+
 @pytest.fixture(scope="function")
-def jwt_token(keycloak_config: KeycloakConfig) -> JWTToken:
+def jwt_token(jwt_token_provider: JWTTokenProvider) -> JWTToken:
     """Obtain a JWT token from Keycloak using client credentials flow.
     
-    Scope: function - Each test gets a fresh token to prevent expiration.
-    Keycloak tokens expire after 5 minutes. Using function scope ensures each
-    test gets a fresh token, eliminating any possibility of expiration during
-    test execution.
+    Scope: function - Each test gets a token with at least two minutes of
+    validity left. Keycloak tokens expire after 5 minutes; the cached token
+    is reused across tests and only requested again when it nears expiry.
     
-    For fixtures that need tokens and run longer than 5 minutes, call
-    obtain_jwt_token(keycloak_config) directly instead of depending on this fixture.
+    For fixtures that need tokens and run longer than 5 minutes, depend on
+    jwt_token_provider and call get() right before the token is used.
     """
-    return obtain_jwt_token(keycloak_config)
+    return jwt_token_provider.get()
 
 
 @pytest.fixture(scope="session")
@@ -396,61 +445,94 @@ def unique_cluster_id() -> str:
     return f"test-cluster-{int(time.time())}-{uuid.uuid4().hex[:8]}"
 
 
+TEST_CSV_HEADER = (
+    "report_period_start,report_period_end,interval_start,interval_end,"
+    "container_name,pod,owner_name,owner_kind,workload,workload_type,"
+    "namespace,image_name,node,resource_id,"
+    "cpu_request_container_avg,cpu_request_container_sum,"
+    "cpu_limit_container_avg,cpu_limit_container_sum,"
+    "cpu_usage_container_avg,cpu_usage_container_min,cpu_usage_container_max,cpu_usage_container_sum,"
+    "cpu_throttle_container_avg,cpu_throttle_container_max,cpu_throttle_container_sum,"
+    "memory_request_container_avg,memory_request_container_sum,"
+    "memory_limit_container_avg,memory_limit_container_sum,"
+    "memory_usage_container_avg,memory_usage_container_min,memory_usage_container_max,memory_usage_container_sum,"
+    "memory_rss_usage_container_avg,memory_rss_usage_container_min,memory_rss_usage_container_max,memory_rss_usage_container_sum"
+)
+
+TEST_CSV_ROW_TEMPLATE = (
+    "{date},{date},{start},{end},"
+    "test-container,test-pod-123,test-deployment,Deployment,test-workload,deployment,"
+    "test-namespace,quay.io/test/image:latest,worker-node-1,resource-123,"
+    "0.5,0.5,1.0,1.0,{cpu},0.185671,0.324131,{cpu},"
+    "0.001,0.002,0.001,"
+    "536870912,536870912,1073741824,1073741824,"
+    "{mem},410009344,420900544,{mem},"
+    "{rss},390293568,396371392,{rss}"
+)
+
+
 @pytest.fixture
 def test_csv_data() -> str:
     """Generate test CSV data with current timestamps."""
-    now = datetime.now(timezone.utc)
-    now_date = now.strftime("%Y-%m-%d")
-
-    def format_timestamp(minutes_ago: int) -> str:
-        ts = now - timedelta(minutes=minutes_ago)
-        return ts.strftime("%Y-%m-%d %H:%M:%S -0000 UTC")
-
-    intervals = [
-        (75, 60),
-        (60, 45),
-        (45, 30),
-        (30, 15),
+    now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+    now_date = now.date().isoformat()
+
+    # Consecutive 15-minute intervals share boundaries, so format each
+    # boundary once: 75, 60, 45, 30 and 15 minutes ago. isoformat() of a
+    # naive second-precision datetime is exactly "YYYY-MM-DD HH:MM:SS"
+    timestamps = [
+        f"{(now - timedelta(minutes=minutes_ago)).isoformat(' ')} -0000 UTC"
+        for minutes_ago in (75, 60, 45, 30, 15)
     ]
 
-    header = (
-        "report_period_start,report_period_end,interval_start,interval_end,"
-        "container_name,pod,owner_name,owner_kind,workload,workload_type,"
-        "namespace,image_name,node,resource_id,"
-        "cpu_request_container_avg,cpu_request_container_sum,"
-        "cpu_limit_container_avg,cpu_limit_container_sum,"
-        "cpu_usage_container_avg,cpu_usage_container_min,cpu_usage_container_max,cpu_usage_container_sum,"
-        "cpu_throttle_container_avg,cpu_throttle_container_max,cpu_throttle_container_sum,"
-        "memory_request_container_avg,memory_request_container_sum,"
-        "memory_limit_container_avg,memory_limit_container_sum,"
-        "memory_usage_container_avg,memory_usage_container_min,memory_usage_container_max,memory_usage_container_sum,"
-        "memory_rss_usage_container_avg,memory_rss_usage_container_min,memory_rss_usage_container_max,memory_rss_usage_container_sum"
-    )
-
-    rows = [header]
     cpu_usages = [0.247832, 0.265423, 0.289567, 0.234567]
     memory_usages = [413587266, 427891456, 445678901, 398765432]
 
-    for i, (start_ago, end_ago) in enumerate(intervals):
-        row = (
-            f"{now_date},{now_date},"
-            f"{format_timestamp(start_ago)},{format_timestamp(end_ago)},"
-            "test-container,test-pod-123,test-deployment,Deployment,test-workload,deployment,"
-            "test-namespace,quay.io/test/image:latest,worker-node-1,resource-123,"
-            f"0.5,0.5,1.0,1.0,{cpu_usages[i]},0.185671,0.324131,{cpu_usages[i]},"
-            "0.001,0.002,0.001,"
-            f"536870912,536870912,1073741824,1073741824,"
-            f"{memory_usages[i]},410009344,420900544,{memory_usages[i]},"
-            f"{memory_usages[i] - 20000000},390293568,396371392,{memory_usages[i] - 20000000}"
+    rows = (
+        TEST_CSV_ROW_TEMPLATE.format(
+            date=now_date,
+            start=timestamps[i],
+            end=timestamps[i + 1],
+            cpu=cpu_usages[i],
+            mem=memory_usages[i],
+            rss=memory_usages[i] - 20000000,
         )
-        rows.append(row)
+        for i in range(len(cpu_usages))
+    )
 
-    return "\n".join(rows)
+    return "\n".join([TEST_CSV_HEADER, *rows])
 
 
-@pytest.fixture
-def http_session() -> requests.Session:
-    """Create a requests session with SSL verification disabled."""
+# Connection pools shared by every http_session, so keep-alive connections
+# (and their TLS handshakes) carry over between tests
+_HTTP_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+
+
+def _pooled_session() -> requests.Session:
+    """Create a requests session on the shared adapter, without SSL verification."""
     session = requests.Session()
     session.verify = False
+    session.mount("https://", _HTTP_ADAPTER)
+    session.mount("http://", _HTTP_ADAPTER)
     return session
+
+
+@pytest.fixture
+def http_session() -> requests.Session:
+    """Create a requests session with SSL verification disabled.
+    
+    Each test gets its own session (and cookie jar), but all sessions share
+    one pooled adapter.
+    """
+    return _pooled_session()
+
+
+@pytest.fixture(scope="session")
+def shared_http_session() -> requests.Session:
+    """Session-scoped requests session for session-scoped fixtures.
+    
+    Used for one-off probes (reachability checks, discovery, token grants)
+    that can't take the function-scoped http_session but should still go
+    through the pooled adapter.
+    """
+    return _pooled_session()
@@ -14,20 +14,34 @@ Key components:
 - Cleanup utilities
 """
 
+import functools
 import json
 import os
+import random
+import re
+import secrets
 import shutil
 import subprocess
 import tempfile
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import requests
+import yaml
+
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # except clauses keep working
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 from utils import (
+    create_rh_identity_header,
     create_upload_package_from_files,
     execute_db_query,
     exec_in_pod,
@@ -68,13 +82,21 @@ DEFAULT_S3_BUCKET = "koku-bucket"
 UPLOAD_CONTENT_TYPE = "application/vnd.redhat.hccm.filename+tgz"
 
 
+# Use the LibYAML emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NISEConfig:
-    """Configuration for NISE data generation."""
+    """Configuration for NISE data generation.
+    
+    Immutable, so one instance can be shared across generation threads and
+    used as a dict/cache key.
+    """
     node_name: str = DEFAULT_NISE_CONFIG["node_name"]
     namespace: str = DEFAULT_NISE_CONFIG["namespace"]
     pod_name: str = DEFAULT_NISE_CONFIG["pod_name"]
@@ -109,35 +131,44 @@ class NISEConfig:
     
     def to_yaml(self, cluster_id: str, start_date: datetime, end_date: datetime) -> str:
         """Generate NISE static report YAML."""
-        return f"""---
-generators:
-  - OCPGenerator:
-      start_date: {start_date.strftime('%Y-%m-%d')}
-      end_date: {end_date.strftime('%Y-%m-%d')}
-      nodes:
-        - node:
-          node_name: {self.node_name}
-          cpu_cores: {self.cpu_cores}
-          memory_gig: {self.memory_gig}
-          resource_id: {self.resource_id}
-          labels: node-role.kubernetes.io/worker:true|kubernetes.io/os:linux
-          namespaces:
-            {self.namespace}:
-              labels: openshift.io/cluster-monitoring:true
-              pods:
-                - pod:
-                  pod_name: {self.pod_name}
-                  cpu_request: {self.cpu_request}
-                  mem_request_gig: {self.mem_request_gig}
-                  cpu_limit: {self.cpu_limit}
-                  mem_limit_gig: {self.mem_limit_gig}
-                  pod_seconds: {self.pod_seconds}
-                  cpu_usage:
-                    full_period: {self.cpu_usage}
-                  mem_usage_gig:
-                    full_period: {self.mem_usage_gig}
-                  labels: {self.labels}
-"""
+        # NISE expects the "- node:" / "- pod:" marker keys alongside the
+        # item fields, i.e. a null-valued key in the same mapping
+        pod = {
+            "pod": None,
+            "pod_name": self.pod_name,
+            "cpu_request": self.cpu_request,
+            "mem_request_gig": self.mem_request_gig,
+            "cpu_limit": self.cpu_limit,
+            "mem_limit_gig": self.mem_limit_gig,
+            "pod_seconds": self.pod_seconds,
+            "cpu_usage": {"full_period": self.cpu_usage},
+            "mem_usage_gig": {"full_period": self.mem_usage_gig},
+            "labels": self.labels,
+        }
+        node = {
+            "node": None,
+            "node_name": self.node_name,
+            "cpu_cores": self.cpu_cores,
+            "memory_gig": self.memory_gig,
+            "resource_id": self.resource_id,
+            "labels": "node-role.kubernetes.io/worker:true|kubernetes.io/os:linux",
+            "namespaces": {
+                self.namespace: {
+                    "labels": "openshift.io/cluster-monitoring:true",
+                    "pods": [pod],
+                },
+            },
+        }
+        report = {
+            "generators": [{
+                "OCPGenerator": {
+                    "start_date": start_date.date(),
+                    "end_date": end_date.date(),
+                    "nodes": [node],
+                },
+            }],
+        }
+        return "---\n" + yaml.dump(report, Dumper=_YAML_DUMPER, sort_keys=False)
 
 
 @dataclass
@@ -153,8 +184,15 @@ class SourceRegistration:
 # NISE Utilities
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def is_nise_available() -> bool:
-    """Check if NISE is available for data generation."""
+    """Check if NISE is available for data generation.
+    
+    The probe runs once per session; install_nise clears the cached result.
+    """
+    # PATH lookup first: no fork when nise is not installed at all
+    if shutil.which("nise") is None:
+        return False
     try:
         result = subprocess.run(
             ["nise", "--version"],
@@ -177,6 +215,7 @@ def install_nise() -> bool:
             text=True,
             timeout=120,
         )
+        is_nise_available.cache_clear()
         return result.returncode == 0
     except Exception:
         return False
@@ -189,6 +228,28 @@ def ensure_nise_available() -> bool:
     return install_nise()
 
 
+# NISE report type in a filename -> generate_nise_data result key
+_NISE_FILE_CATEGORY_RE = re.compile(r"pod_usage|ros_usage|node_label|namespace_label")
+_NISE_FILE_CATEGORIES = {
+    "pod_usage": "pod_usage_files",
+    "ros_usage": "ros_usage_files",
+    "node_label": "node_label_files",
+    "namespace_label": "namespace_label_files",
+}
+
+
+def _iter_csv_files(root: str) -> Iterator[Tuple[str, str]]:
+    """Yield (filename, path) for every CSV file directly in root.
+    
+    `nise report ocp` writes its monthly CSVs flat into its working
+    directory, so a single directory read covers all output.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.endswith(".csv") and entry.is_file():
+                yield entry.name, entry.path
+
+
 def generate_nise_data(
     cluster_id: str,
     start_date: datetime,
@@ -215,8 +276,9 @@ def generate_nise_data(
     
     yaml_content = config.to_yaml(cluster_id, start_date, end_date)
     yaml_path = os.path.join(output_dir, "static_report.yml")
-    with open(yaml_path, "w") as f:
-        f.write(yaml_content)
+    # Binary write: skips the text-layer wrapper and its encode-on-write buffer
+    with open(yaml_path, "wb") as f:
+        f.write(yaml_content.encode("utf-8"))
     
     nise_output = os.path.join(output_dir, "nise_output")
     os.makedirs(nise_output, exist_ok=True)
@@ -251,20 +313,11 @@ def generate_nise_data(
         "all_files": [],
     }
     
-    for root, _, filenames in os.walk(nise_output):
-        for f in filenames:
-            if f.endswith(".csv"):
-                full_path = os.path.join(root, f)
-                files["all_files"].append(full_path)
-                
-                if "pod_usage" in f:
-                    files["pod_usage_files"].append(full_path)
-                elif "ros_usage" in f:
-                    files["ros_usage_files"].append(full_path)
-                elif "node_label" in f:
-                    files["node_label_files"].append(full_path)
-                elif "namespace_label" in f:
-                    files["namespace_label_files"].append(full_path)
+    for name, full_path in _iter_csv_files(nise_output):
+        files["all_files"].append(full_path)
+        match = _NISE_FILE_CATEGORY_RE.search(name)
+        if match:
+            files[_NISE_FILE_CATEGORIES[match.group()]].append(full_path)
     
     # Fall back: if no ros_usage files, use pod_usage
     if not files["ros_usage_files"]:
@@ -287,7 +340,7 @@ def generate_cluster_id(prefix: str = "") -> str:
         Unique cluster ID like "e2e-pytest-cost-val-abc12345"
     """
     timestamp = int(time.time())
-    unique = uuid.uuid4().hex[:8]
+    unique = secrets.token_hex(4)
     
     if prefix:
         return f"{E2E_CLUSTER_PREFIX}{prefix}-{unique}"
@@ -306,6 +359,93 @@ def get_koku_api_url(helm_release_name: str, namespace: str) -> str:
     )
 
 
+# Marker written after each response by batch_curl_get
+_BATCH_RESPONSE_END = "__END__"
+
+# Runs one curl GET per URL argument; the identity header is passed as $1 so
+# nothing needs shell quoting
+_BATCH_CURL_SCRIPT = (
+    'identity="$1"; shift; '
+    'for url in "$@"; do '
+    "curl -s -w '\\n__HTTP_CODE__:%{http_code}' "
+    "-H 'Content-Type: application/json' "
+    '-H "X-Rh-Identity: $identity" "$url"; '
+    f"printf '\\n{_BATCH_RESPONSE_END}\\n'; "
+    "done"
+)
+
+
+def batch_curl_get(
+    namespace: str,
+    pod: str,
+    urls: List[str],
+    rh_identity_header: str,
+    container: str = "ingress",
+    timeout: int = 60,
+) -> Optional[List[Tuple[Optional[str], str]]]:
+    """Issue several GET requests from a pod in a single exec.
+    
+    Each exec_in_pod call is a full oc exec round trip, so independent reads
+    against the Koku API are cheaper when they share one shell.
+    
+    Args:
+        namespace: Kubernetes namespace
+        pod: Pod name for executing curl commands (typically ingress pod)
+        urls: URLs to GET, in order
+        rh_identity_header: Base64-encoded X-Rh-Identity header value
+        container: Container name in the pod (default: "ingress")
+        timeout: Timeout in seconds for the whole batch
+    
+    Returns:
+        List of (http_code, body) tuples in the same order as urls,
+        or None if the exec failed
+    """
+    result = exec_in_pod(
+        namespace,
+        pod,
+        ["sh", "-c", _BATCH_CURL_SCRIPT, "sh", rh_identity_header, *urls],
+        container=container,
+        timeout=timeout,
+    )
+    
+    if result is None:
+        return None
+    
+    responses = []
+    for chunk in result.split(f"\n{_BATCH_RESPONSE_END}\n")[:len(urls)]:
+        body, sep, http_code = chunk.rpartition("__HTTP_CODE__:")
+        if sep:
+            responses.append((http_code.strip(), body.strip()))
+        else:
+            responses.append((None, chunk.strip()))
+    
+    if len(responses) != len(urls):
+        return None
+    return responses
+
+
+# (listing URL, type name) -> id; type catalogs are static for a deployment
+_TYPE_IDS: Dict[Tuple[str, str], str] = {}
+
+
+def _find_type_id(url: str, body: str, name: str) -> Optional[str]:
+    """Return the id of the entry called name in a source/application types listing.
+    
+    Found ids are cached in _TYPE_IDS under (url, name).
+    """
+    try:
+        data = _json_loads(body)
+    except json.JSONDecodeError:
+        return None
+    for entry in data.get("data", []):
+        if entry.get("name") == name:
+            type_id = entry.get("id")
+            if type_id:
+                _TYPE_IDS[(url, name)] = type_id
+            return type_id
+    return None
+
+
 def get_source_type_id(
     namespace: str,
     pod: str,
@@ -327,12 +467,16 @@ def get_source_type_id(
     Returns:
         Source type ID as string, or None if not found
     """
+    url = f"{api_url}/source_types"
+    if (url, source_type_name) in _TYPE_IDS:
+        return _TYPE_IDS[(url, source_type_name)]
+    
     result = exec_in_pod(
         namespace,
         pod,
         [
             "curl", "-s",
-            f"{api_url}/source_types",
+            url,
             "-H", "Content-Type: application/json",
             "-H", f"X-Rh-Identity: {rh_identity_header}",
         ],
@@ -342,15 +486,7 @@ def get_source_type_id(
     if not result:
         return None
     
-    try:
-        data = json.loads(result)
-        for st in data.get("data", []):
-            if st.get("name") == source_type_name:
-                return st.get("id")
-    except json.JSONDecodeError:
-        pass
-    
-    return None
+    return _find_type_id(url, result, source_type_name)
 
 
 def get_application_type_id(
@@ -374,12 +510,16 @@ def get_application_type_id(
     Returns:
         Application type ID as string, or None if not found
     """
+    url = f"{api_url}/application_types"
+    if (url, app_type_name) in _TYPE_IDS:
+        return _TYPE_IDS[(url, app_type_name)]
+    
     result = exec_in_pod(
         namespace,
         pod,
         [
             "curl", "-s",
-            f"{api_url}/application_types",
+            url,
             "-H", "Content-Type: application/json",
             "-H", f"X-Rh-Identity: {rh_identity_header}",
         ],
@@ -389,15 +529,53 @@ def get_application_type_id(
     if not result:
         return None
     
-    try:
-        data = json.loads(result)
-        for at in data.get("data", []):
-            if at.get("name") == app_type_name:
-                return at.get("id")
-    except json.JSONDecodeError:
-        pass
+    return _find_type_id(url, result, app_type_name)
+
+
+def get_type_ids(
+    namespace: str,
+    pod: str,
+    api_url: str,
+    rh_identity_header: str,
+    source_type_name: str = "openshift",
+    app_type_name: str = "/insights/platform/cost-management",
+    container: str = "ingress",
+) -> Tuple[Optional[str], Optional[str]]:
+    """Get the source type ID and application type ID with a single pod exec.
     
-    return None
+    Args:
+        namespace: Kubernetes namespace
+        pod: Pod name for executing curl commands (typically ingress pod)
+        api_url: Koku API URL (reads or writes)
+        rh_identity_header: Base64-encoded X-Rh-Identity header value
+        source_type_name: Name of the source type (default: "openshift")
+        app_type_name: Name of the application type
+        container: Container name in the pod (default: "ingress")
+    
+    Returns:
+        Tuple of (source type ID, application type ID); either may be None
+    """
+    lookups = [
+        (f"{api_url}/source_types", source_type_name),
+        (f"{api_url}/application_types", app_type_name),
+    ]
+    if all(key in _TYPE_IDS for key in lookups):
+        return tuple(_TYPE_IDS[key] for key in lookups)
+    
+    responses = batch_curl_get(
+        namespace,
+        pod,
+        [url for url, _ in lookups],
+        rh_identity_header,
+        container=container,
+    )
+    if not responses:
+        return None, None
+    
+    return tuple(
+        _find_type_id(url, body, name)
+        for (url, name), (_, body) in zip(lookups, responses)
+    )
 
 
 def register_source(
@@ -412,6 +590,7 @@ def register_source(
     container: str = "ingress",
     max_retries: int = 5,
     initial_retry_delay: int = 5,
+    max_wait: int = 300,
 ) -> SourceRegistration:
     """Register a source in Koku Sources API.
     
@@ -420,7 +599,7 @@ def register_source(
     2. An application linked to cost-management with cluster_id in extra
     
     Note: On first run for a new org, tenant schema creation can be slow,
-    so this function uses retry logic with exponential backoff.
+    so this function uses retry logic with jittered exponential backoff.
     
     Args:
         namespace: Kubernetes namespace
@@ -434,20 +613,17 @@ def register_source(
         container: Container name in the pod (default: "ingress")
         max_retries: Maximum number of retry attempts (default: 5)
         initial_retry_delay: Initial delay between retries in seconds (default: 5)
+        max_wait: Overall time budget for source creation in seconds (default: 300)
     
     Returns:
         SourceRegistration with source details
     """
-    source_type_id = get_source_type_id(
+    source_type_id, app_type_id = get_type_ids(
         namespace, pod, api_url, rh_identity_header, container=container
     )
     if not source_type_id:
         raise RuntimeError("Could not get OpenShift source type ID")
     
-    app_type_id = get_application_type_id(
-        namespace, pod, api_url, rh_identity_header, container=container
-    )
-    
     # Generate source name using the unique suffix of cluster_id
     if not source_name:
         source_name = f"e2e-source-{cluster_id[-8:]}"
@@ -461,14 +637,20 @@ def register_source(
     
     # Retry logic for source creation
     # First request may fail due to tenant schema creation (slow operation)
-    retry_delay = initial_retry_delay
+    deadline = time.monotonic() + max_wait
     source_id = None
     last_error = None
     
     for attempt in range(max_retries):
         if attempt > 0:
+            # Exponential backoff capped at 30s, jittered over the upper half
+            # so parallel registrations don't retry in lockstep
+            backoff = min(initial_retry_delay * 2 ** (attempt - 1), 30)
+            retry_delay = random.uniform(backoff / 2, backoff)
+            if time.monotonic() + retry_delay > deadline:
+                last_error = f"{last_error} (gave up: {max_wait}s budget exhausted)"
+                break
             time.sleep(retry_delay)
-            retry_delay = min(retry_delay * 2, 30)  # Exponential backoff, max 30s
         
         result = exec_in_pod(
             namespace,
@@ -488,12 +670,14 @@ def register_source(
             last_error = "exec_in_pod returned None (curl failed or timed out)"
             continue
         
-        # Parse response and status code
-        http_code = None
-        if "__HTTP_CODE__:" in result:
-            body, http_code = result.rsplit("__HTTP_CODE__:", 1)
+        # Parse response and status code; the marker is at the tail, so a
+        # single backward scan splits body from code
+        body, sep, http_code = result.rpartition("__HTTP_CODE__:")
+        if sep:
             result = body.strip()
             http_code = http_code.strip()
+        else:
+            http_code = None
         
         if http_code and http_code not in ("200", "201"):
             last_error = f"HTTP {http_code}: {result[:200]}"
@@ -504,7 +688,7 @@ def register_source(
             break
         
         try:
-            source_data = json.loads(result)
+            source_data = _json_loads(result)
             source_id = source_data.get("id")
             if source_id:
                 break
@@ -590,6 +774,29 @@ def delete_source(
 # Upload Utilities
 # =============================================================================
 
+_UPLOAD_SESSION: Optional[requests.Session] = None
+
+
+def upload_session() -> requests.Session:
+    """Return the shared upload session, creating it on first use.
+    
+    The session keeps connections to the ingress alive across uploads and
+    has SSL verification disabled for self-signed certs. Retries are left
+    to upload_with_retry, so the adapter does none of its own.
+    """
+    global _UPLOAD_SESSION
+    if _UPLOAD_SESSION is None:
+        session = requests.Session()
+        session.verify = False
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8, pool_maxsize=16, max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _UPLOAD_SESSION = session
+    return _UPLOAD_SESSION
+
+
 def upload_with_retry(
     session: requests.Session,
     url: str,
@@ -601,7 +808,8 @@ def upload_with_retry(
     """Upload file with retry logic for transient errors.
     
     Args:
-        session: Requests session (should have verify=False for self-signed certs)
+        session: Requests session (should have verify=False for self-signed certs);
+            pass upload_session() to reuse pooled connections across uploads
         url: Upload URL
         package_path: Path to the tar.gz package
         auth_header: Authorization header dict
@@ -616,15 +824,18 @@ def upload_with_retry(
     """
     last_error = None
     
+    # Read once so retries resend from memory instead of reopening the file
+    with open(package_path, "rb") as f:
+        package_data = f.read()
+    
     for attempt in range(max_retries):
         try:
-            with open(package_path, "rb") as f:
-                response = session.post(
-                    url,
-                    files={"file": ("cost-mgmt.tar.gz", f, UPLOAD_CONTENT_TYPE)},
-                    headers=auth_header,
-                    timeout=60,
-                )
+            response = session.post(
+                url,
+                files={"file": ("cost-mgmt.tar.gz", package_data, UPLOAD_CONTENT_TYPE)},
+                headers=auth_header,
+                timeout=60,
+            )
             
             if response.status_code in [200, 201, 202]:
                 return response
@@ -668,12 +879,13 @@ def wait_for_provider(
     def check_provider():
         result = execute_db_query(
             namespace, db_pod, "costonprem_koku", "koku_user",
-            f"""
+            """
             SELECT p.uuid FROM api_provider p
             JOIN api_providerauthentication pa ON p.authentication_id = pa.id
-            WHERE pa.credentials->>'cluster_id' = '{cluster_id}'
-               OR p.additional_context->>'cluster_id' = '{cluster_id}'
-            """
+            WHERE pa.credentials->>'cluster_id' = :'cluster_id'
+               OR p.additional_context->>'cluster_id' = :'cluster_id'
+            """,
+            params={"cluster_id": cluster_id},
         )
         return result and result[0][0]
     
@@ -694,28 +906,36 @@ def wait_for_summary_tables(
     found_schema = {"name": None}
     
     def check_summary():
-        result = execute_db_query(
-            namespace, db_pod, "costonprem_koku", "koku_user",
-            f"""
-            SELECT c.schema_name FROM reporting_common_costusagereportmanifest m
-            JOIN api_provider p ON m.provider_id = p.uuid
-            JOIN api_customer c ON p.customer_id = c.id
-            WHERE m.cluster_id = '{cluster_id}' LIMIT 1
-            """
-        )
-        if not result or not result[0][0]:
-            return False
+        # The tenant schema doesn't change once the manifest exists, so look
+        # it up only until found and then poll just for summary rows
+        if not found_schema["name"]:
+            result = execute_db_query(
+                namespace, db_pod, "costonprem_koku", "koku_user",
+                """
+                SELECT c.schema_name FROM reporting_common_costusagereportmanifest m
+                JOIN api_provider p ON m.provider_id = p.uuid
+                JOIN api_customer c ON p.customer_id = c.id
+                WHERE m.cluster_id = :'cluster_id' LIMIT 1
+                """,
+                params={"cluster_id": cluster_id},
+            )
+            if not result or not result[0][0]:
+                return False
+            found_schema["name"] = result[0][0].strip()
         
-        schema = result[0][0].strip()
+        schema = found_schema["name"]
         result = execute_db_query(
             namespace, db_pod, "costonprem_koku", "koku_user",
-            f"SELECT COUNT(*) FROM {schema}.reporting_ocpusagelineitem_daily_summary WHERE cluster_id = '{cluster_id}'"
+            f"""
+            SELECT EXISTS (
+                SELECT 1 FROM {schema}.reporting_ocpusagelineitem_daily_summary
+                WHERE cluster_id = :'cluster_id'
+            )
+            """,
+            params={"cluster_id": cluster_id},
         )
         
-        if result and int(result[0][0]) > 0:
-            found_schema["name"] = schema
-            return True
-        return False
+        return bool(result) and result[0][0] == "t"
     
     if wait_for_condition(check_summary, timeout=timeout, interval=interval):
         return found_schema["name"]
@@ -736,19 +956,21 @@ def cleanup_database_records(
         # Delete file statuses first (foreign key constraint)
         execute_db_query(
             namespace, db_pod, "costonprem_koku", "koku_user",
-            f"""
+            """
             DELETE FROM reporting_common_costusagereportstatus
             WHERE manifest_id IN (
                 SELECT id FROM reporting_common_costusagereportmanifest
-                WHERE cluster_id = '{cluster_id}'
+                WHERE cluster_id = :'cluster_id'
             )
-            """
+            """,
+            params={"cluster_id": cluster_id},
         )
         
         # Delete manifests
         execute_db_query(
             namespace, db_pod, "costonprem_koku", "koku_user",
-            f"DELETE FROM reporting_common_costusagereportmanifest WHERE cluster_id = '{cluster_id}'"
+            "DELETE FROM reporting_common_costusagereportmanifest WHERE cluster_id = :'cluster_id'",
+            params={"cluster_id": cluster_id},
         )
         
         return True
@@ -784,15 +1006,27 @@ def cleanup_e2e_sources(
         if not result:
             return 0
         
-        sources = json.loads(result)
-        for source in sources.get("data", []):
-            source_name = source.get("name", "")
-            source_id = source.get("id")
-            
-            if source_id and source_name.startswith(prefix):
-                if delete_source(namespace, listener_pod, sources_api_url, source_id, org_id):
-                    deleted += 1
-                    time.sleep(1)  # Brief pause between deletions
+        sources = _json_loads(result)
+        source_ids = [
+            source["id"]
+            for source in sources.get("data", [])
+            if source.get("id") and source.get("name", "").startswith(prefix)
+        ]
+        if not source_ids:
+            return 0
+        
+        rh_identity = create_rh_identity_header(org_id)
+        
+        # Each delete is an independent pod exec, so run a bounded number at once
+        with ThreadPoolExecutor(max_workers=min(len(source_ids), 8)) as executor:
+            results = executor.map(
+                lambda source_id: delete_source(
+                    namespace, listener_pod, sources_api_url, rh_identity,
+                    source_id, container="sources-listener",
+                ),
+                source_ids,
+            )
+            deleted = sum(results)
     except Exception:
         pass
     
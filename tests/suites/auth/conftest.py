@@ -4,15 +4,20 @@ Auth suite fixtures.
 Fixtures specific to JWT authentication testing.
 """
 
+import base64
+import json
+import os
+from typing import NamedTuple
+
 import pytest
 import requests
 
+from utils import decode_jwt_payload, get_secret_value, run_oc_command
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ui_client_config(cluster_config, keycloak_config):
     """Get UI client configuration for OAuth testing."""
-    from utils import get_secret_value
-    
     client_id = "cost-management-ui"
     client_secret = get_secret_value(
         cluster_config.keycloak_namespace,
@@ -28,10 +33,118 @@ def ui_client_config(cluster_config, keycloak_config):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_credentials():
     """Get test user credentials for password grant flow."""
     return {
         "username": "test",
         "password": "test",
     }
+
+
+@pytest.fixture(scope="session")
+def oidc_discovery(keycloak_config, shared_http_session) -> requests.Response:
+    """Fetch the realm's OpenID configuration once for the Keycloak tests."""
+    well_known_url = (
+        f"{keycloak_config.url}/realms/{keycloak_config.realm}/"
+        ".well-known/openid-configuration"
+    )
+    return shared_http_session.get(well_known_url, timeout=10)
+
+
+@pytest.fixture(scope="module")
+def ui_resources(cluster_config) -> dict:
+    """Look up the UI route host and pod phase with a single `oc get`."""
+    result = run_oc_command([
+        "get", "route,pod", "-n", cluster_config.namespace,
+        "-l", "app.kubernetes.io/component=ui",
+        "-o", "json"
+    ], check=False)
+
+    resources = {"route_host": None, "pod_phase": None}
+    if result.returncode != 0 or not result.stdout.strip():
+        return resources
+
+    for item in json.loads(result.stdout).get("items", []):
+        if item["kind"] == "Route" and resources["route_host"] is None:
+            resources["route_host"] = item["spec"].get("host")
+        elif item["kind"] == "Pod" and resources["pod_phase"] is None:
+            resources["pod_phase"] = item.get("status", {}).get("phase")
+    return resources
+
+
+class PasswordGrantToken(NamedTuple):
+    """Access token from the UI client's password grant and its decoded payload."""
+
+    access_token: str | None
+    payload: dict | None
+
+
+@pytest.fixture(scope="session")
+def password_grant_token(
+    keycloak_config, ui_client_config, test_user_credentials, shared_http_session
+) -> PasswordGrantToken:
+    """Obtain one token via password grant for all UI OAuth tests."""
+    data = {
+        "username": test_user_credentials["username"],
+        "password": test_user_credentials["password"],
+        "grant_type": "password",
+        "client_id": ui_client_config["client_id"],
+        "scope": "openid profile email",
+    }
+    # Without a secret, try as a public client
+    if ui_client_config.get("client_secret"):
+        data["client_secret"] = ui_client_config["client_secret"]
+
+    token_url = (
+        f"{keycloak_config.url}/realms/{keycloak_config.realm}/"
+        "protocol/openid-connect/token"
+    )
+
+    response = shared_http_session.post(token_url, data=data, timeout=30)
+
+    if response.status_code != 200:
+        pytest.skip(f"Password grant failed: {response.status_code}")
+
+    access_token = response.json().get("access_token")
+    if not access_token:
+        return PasswordGrantToken(access_token=None, payload=None)
+
+    return PasswordGrantToken(
+        access_token=access_token, payload=decode_jwt_payload(access_token)
+    )
+
+
+@pytest.fixture(scope="session")
+def gateway_reachable(gateway_url: str, shared_http_session) -> bool:
+    """Probe the gateway once per session; tests skip when it is down."""
+    try:
+        # Try the ingress ready endpoint through the gateway
+        response = shared_http_session.get(f"{gateway_url}/ingress/ready", timeout=5)
+        return response.status_code != 503
+    except requests.exceptions.RequestException:
+        return False
+
+
+def _b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+# A well-formed RS256 token that no realm key can verify. Random bytes take
+# the same rejection path as a real signature from an unknown key.
+_FAKE_JWT = ".".join([
+    _b64url_encode(json.dumps({"alg": "RS256", "typ": "JWT", "kid": "fake-key"}).encode()),
+    _b64url_encode(json.dumps({
+        "sub": "attacker",
+        "iss": "https://fake-issuer.com",
+        "aud": "cost-management-operator",
+        "exp": 9999999999,
+    }).encode()),
+    _b64url_encode(os.urandom(256)),
+])
+
+
+@pytest.fixture(scope="session")
+def fake_jwt() -> str:
+    """JWT with valid structure but a signature that does not verify."""
+    return _FAKE_JWT
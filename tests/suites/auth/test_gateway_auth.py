@@ -5,70 +5,10 @@ Tests for JWT authentication on the centralized API gateway.
 The gateway handles all external API traffic with Keycloak JWT validation.
 """
 
-import subprocess
-import tempfile
-
 import pytest
 import requests
 
 
-def _check_gateway_reachable(gateway_url: str, http_session: requests.Session) -> bool:
-    """Check if gateway service is reachable."""
-    try:
-        # Try the ingress ready endpoint through the gateway
-        response = http_session.get(f"{gateway_url}/ingress/ready", timeout=5)
-        return response.status_code != 503
-    except requests.exceptions.RequestException:
-        return False
-
-
-def _generate_fake_jwt() -> str | None:
-    """Generate a fake JWT with valid structure but wrong signature."""
-    try:
-        import base64
-        import json
-        import os
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".pem", delete=False) as f:
-            key_file = f.name
-
-        subprocess.run(
-            ["openssl", "genrsa", "-out", key_file, "2048"],
-            capture_output=True,
-            check=True,
-        )
-
-        header = {"alg": "RS256", "typ": "JWT", "kid": "fake-key"}
-        payload = {
-            "sub": "attacker",
-            "iss": "https://fake-issuer.com",
-            "aud": "cost-management-operator",
-            "exp": 9999999999,
-        }
-
-        def b64url_encode(data: bytes) -> str:
-            return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
-
-        header_b64 = b64url_encode(json.dumps(header).encode())
-        payload_b64 = b64url_encode(json.dumps(payload).encode())
-
-        message = f"{header_b64}.{payload_b64}"
-        sign_result = subprocess.run(
-            ["openssl", "dgst", "-sha256", "-sign", key_file],
-            input=message.encode(),
-            capture_output=True,
-            check=True,
-        )
-        signature_b64 = b64url_encode(sign_result.stdout)
-
-        os.unlink(key_file)
-
-        return f"{header_b64}.{payload_b64}.{signature_b64}"
-
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return None
-
-
 @pytest.mark.auth
 @pytest.mark.integration
 class TestGatewayJWTAuthentication:
@@ -97,10 +37,10 @@ class TestGatewayJWTAuthentication:
         )
 
     def test_request_without_token_rejected(
-        self, gateway_url: str, http_session: requests.Session
+        self, gateway_url: str, http_session: requests.Session, gateway_reachable: bool
     ):
         """Verify requests without JWT token are rejected with 401."""
-        if not _check_gateway_reachable(gateway_url, http_session):
+        if not gateway_reachable:
             pytest.skip("Gateway service not available")
 
         response = http_session.post(f"{gateway_url}/ingress/v1/upload", timeout=10)
@@ -110,10 +50,10 @@ class TestGatewayJWTAuthentication:
         )
 
     def test_malformed_token_rejected(
-        self, gateway_url: str, http_session: requests.Session
+        self, gateway_url: str, http_session: requests.Session, gateway_reachable: bool
     ):
         """Verify requests with malformed JWT token are rejected."""
-        if not _check_gateway_reachable(gateway_url, http_session):
+        if not gateway_reachable:
             pytest.skip("Gateway service not available")
 
         response = http_session.post(
@@ -127,16 +67,16 @@ class TestGatewayJWTAuthentication:
         )
 
     def test_fake_signature_token_rejected(
-        self, gateway_url: str, http_session: requests.Session
+        self,
+        gateway_url: str,
+        http_session: requests.Session,
+        gateway_reachable: bool,
+        fake_jwt: str,
     ):
         """Verify JWT tokens with invalid signatures are rejected."""
-        if not _check_gateway_reachable(gateway_url, http_session):
+        if not gateway_reachable:
             pytest.skip("Gateway service not available")
 
-        fake_jwt = _generate_fake_jwt()
-        if fake_jwt is None:
-            pytest.skip("OpenSSL not available to generate fake JWT")
-
         response = http_session.post(
             f"{gateway_url}/ingress/v1/upload",
             headers={"Authorization": f"Bearer {fake_jwt}"},
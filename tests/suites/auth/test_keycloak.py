@@ -5,6 +5,8 @@ Keycloak connectivity and configuration tests.
 import pytest
 import requests
 
+from utils import decode_jwt_payload
+
 
 @pytest.mark.auth
 @pytest.mark.component
@@ -12,31 +14,19 @@ import requests
 class TestKeycloakConnectivity:
     """Tests for Keycloak connectivity."""
 
-    def test_keycloak_reachable(self, keycloak_config, http_session: requests.Session):
+    def test_keycloak_reachable(self, oidc_discovery: requests.Response):
         """Verify Keycloak is reachable."""
-        well_known_url = (
-            f"{keycloak_config.url}/realms/{keycloak_config.realm}/"
-            ".well-known/openid-configuration"
-        )
-        response = http_session.get(well_known_url, timeout=10)
-
-        assert response.status_code == 200, (
-            f"Keycloak not reachable at {well_known_url}: {response.status_code}"
+        assert oidc_discovery.status_code == 200, (
+            f"Keycloak not reachable at {oidc_discovery.url}: {oidc_discovery.status_code}"
         )
 
-        data = response.json()
+        data = oidc_discovery.json()
         assert "token_endpoint" in data, "Invalid OpenID configuration response"
 
-    def test_oidc_discovery_endpoint(self, keycloak_config, http_session: requests.Session):
+    def test_oidc_discovery_endpoint(self, oidc_discovery: requests.Response):
         """Verify OIDC discovery endpoint returns expected fields."""
-        well_known_url = (
-            f"{keycloak_config.url}/realms/{keycloak_config.realm}/"
-            ".well-known/openid-configuration"
-        )
-        response = http_session.get(well_known_url, timeout=10)
-        
-        assert response.status_code == 200
-        data = response.json()
+        assert oidc_discovery.status_code == 200
+        data = oidc_discovery.json()
         
         required_fields = [
             "issuer",
@@ -68,16 +58,7 @@ class TestJWTTokenAcquisition:
 
     def test_token_payload_decodable(self, jwt_token):
         """Verify JWT payload can be decoded."""
-        import base64
-        import json
-        
-        payload_b64 = jwt_token.access_token.split(".")[1]
-        # Add padding if needed
-        padding = 4 - len(payload_b64) % 4
-        if padding != 4:
-            payload_b64 += "=" * padding
-        
-        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+        payload = decode_jwt_payload(jwt_token.access_token)
         
         assert "exp" in payload, "Token missing 'exp' claim"
         assert "iss" in payload, "Token missing 'iss' claim"
@@ -11,15 +11,17 @@ This makes cost_validation tests SELF-CONTAINED - they don't depend on other tes
 
 import json
 import os
+import re
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Optional
 
 import pytest
-import requests
 
-from conftest import obtain_jwt_token
+from conftest import JWTTokenProvider
 from e2e_helpers import (
     NISEConfig,
     cleanup_database_records,
@@ -27,8 +29,8 @@ from e2e_helpers import (
     ensure_nise_available,
     generate_cluster_id,
     generate_nise_data,
-    get_koku_api_url,
     register_source,
+    upload_session,
     upload_with_retry,
     wait_for_provider,
     wait_for_summary_tables,
@@ -71,102 +73,113 @@ def cleanup_old_cost_val_clusters(
         
         if result:
             sources = json.loads(result)
+            stale_urls = []
             for source in sources.get("data", []):
                 source_ref = source.get("source_ref", "")
                 if source_ref and source_ref.startswith("cost-val-"):
-                    source_id = source.get("id")
                     print(f"       Deleting old source: {source.get('name')} (ref: {source_ref})")
-                    exec_in_pod(
-                        namespace,
-                        ingress_pod,
-                        [
-                            "curl", "-s", "-X", "DELETE",
-                            f"{api_url}/sources/{source_id}",
-                            "-H", f"X-Rh-Identity: {rh_identity_header}",
-                        ],
-                        container="ingress",
-                    )
+                    stale_urls.append(f"{api_url}/sources/{source.get('id')}")
+            
+            # curl applies -X DELETE to every URL, so one exec removes them all
+            if stale_urls:
+                exec_in_pod(
+                    namespace,
+                    ingress_pod,
+                    [
+                        "curl", "-s", "-X", "DELETE",
+                        "-H", f"X-Rh-Identity: {rh_identity_header}",
+                        *stale_urls,
+                    ],
+                    container="ingress",
+                )
     except Exception as e:
         print(f"       Warning: Could not clean old sources: {e}")
     
-    # Clean up database records for cost-val clusters
-    try:
-        # Delete manifest statuses
-        execute_db_query(
-            namespace, db_pod, "costonprem_koku", "koku_user",
+    # Clean up database records for cost-val clusters. Each step is its own
+    # psql session so one failure (e.g. a provider still referenced elsewhere)
+    # doesn't roll back or skip the others.
+    stale_cleanup = [
+        (
+            "report statuses",
             """
             DELETE FROM reporting_common_costusagereportstatus 
             WHERE manifest_id IN (
                 SELECT id FROM reporting_common_costusagereportmanifest 
                 WHERE cluster_id LIKE 'cost-val-%'
             )
+            """,
+        ),
+        (
+            "manifests",
+            "DELETE FROM reporting_common_costusagereportmanifest WHERE cluster_id LIKE 'cost-val-%'",
+        ),
+        (
+            # Summary rows and tenant-provider mappings (FK constraint on
+            # api_provider) in every tenant schema: summary rows outlive their
+            # provider once the source is deleted. to_regclass skips schemas
+            # without the table, and a failing schema only raises a warning.
+            "tenant summary rows",
             """
-        )
-        
-        # Delete manifests
-        execute_db_query(
-            namespace, db_pod, "costonprem_koku", "koku_user",
-            "DELETE FROM reporting_common_costusagereportmanifest WHERE cluster_id LIKE 'cost-val-%'"
-        )
-        
-        # Get all schemas and clean summary tables + tenant provider mappings
-        schemas = execute_db_query(
-            namespace, db_pod, "costonprem_koku", "koku_user",
-            "SELECT DISTINCT schema_name FROM api_customer WHERE schema_name IS NOT NULL"
-        )
-        
-        if schemas:
-            for row in schemas:
-                schema = row[0].strip() if row[0] else None
-                if schema:
-                    try:
-                        execute_db_query(
-                            namespace, db_pod, "costonprem_koku", "koku_user",
-                            f"DELETE FROM {schema}.reporting_ocpusagelineitem_daily_summary WHERE cluster_id LIKE 'cost-val-%'"
-                        )
-                    except Exception:
-                        pass  # Table might not exist in all schemas
-                    
-                    # Delete tenant-provider mappings (FK constraint on api_provider)
-                    try:
-                        execute_db_query(
-                            namespace, db_pod, "costonprem_koku", "koku_user",
-                            f"""
-                            DELETE FROM {schema}.reporting_tenant_api_provider 
-                            WHERE provider_id IN (
-                                SELECT uuid FROM public.api_provider 
-                                WHERE name LIKE 'cost-validation%'
-                            )
-                            """
-                        )
-                    except Exception:
-                        pass  # Table might not exist in all schemas
-        
-        # Delete providers (after FK references are removed)
-        try:
-            execute_db_query(
-                namespace, db_pod, "costonprem_koku", "koku_user",
-                "DELETE FROM public.api_provider WHERE name LIKE 'cost-validation%'"
-            )
-        except Exception:
-            pass  # May fail if no matching providers
-                        
-    except Exception as e:
-        print(f"       Warning: Could not clean database records: {e}")
-
-
-@pytest.fixture(scope="module")
-def koku_api_url(cluster_config) -> str:
-    """Get Koku API URL for cost management tests (unified deployment)."""
-    return get_koku_api_url(cluster_config.helm_release_name, cluster_config.namespace)
+            DO $$
+            DECLARE
+                r record;
+            BEGIN
+                FOR r IN
+                    SELECT c.schema_name,
+                        to_regclass(c.schema_name || '.reporting_ocpusagelineitem_daily_summary')
+                            IS NOT NULL AS has_summary,
+                        to_regclass(c.schema_name || '.reporting_tenant_api_provider')
+                            IS NOT NULL AS has_tenant_provider
+                    FROM api_customer c
+                    WHERE c.schema_name IS NOT NULL
+                LOOP
+                    BEGIN
+                        IF r.has_summary THEN
+                            EXECUTE format(
+                                'DELETE FROM %I.reporting_ocpusagelineitem_daily_summary '
+                                'WHERE cluster_id LIKE %L',
+                                r.schema_name, 'cost-val-%'
+                            );
+                        END IF;
+                        IF r.has_tenant_provider THEN
+                            EXECUTE format(
+                                'DELETE FROM %I.reporting_tenant_api_provider '
+                                'WHERE provider_id IN ('
+                                'SELECT uuid FROM public.api_provider WHERE name LIKE %L)',
+                                r.schema_name, 'cost-validation%'
+                            );
+                        END IF;
+                    EXCEPTION WHEN OTHERS THEN
+                        RAISE WARNING 'cost-val cleanup of schema % failed: %',
+                            r.schema_name, SQLERRM;
+                    END;
+                END LOOP;
+            END
+            $$
+            """,
+        ),
+        (
+            # After the tenant FK references are removed
+            "providers",
+            "DELETE FROM public.api_provider WHERE name LIKE 'cost-validation%'",
+        ),
+    ]
+    for description, query in stale_cleanup:
+        if execute_db_query(namespace, db_pod, "costonprem_koku", "koku_user", query) is None:
+            print(f"       Warning: Could not clean old cost-val {description}")
 
 
 # =============================================================================
 # E2E Test Data Fixture - Self-Contained Setup for Cost Validation
 # =============================================================================
 
-@pytest.fixture(scope="module")
-def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url, org_id):
+# Koku tenant schemas (e.g. org1234567)
+_SCHEMA_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+@pytest.fixture(scope="session")
+def cost_validation_data(
+    request, cluster_config, s3_config, jwt_token_provider: JWTTokenProvider, ingress_url, org_id
+):
     """Run full E2E setup for cost validation tests - SELF-CONTAINED.
     
     This fixture:
@@ -177,14 +190,29 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
     5. Yields the test context
     6. Cleans up all test data on teardown (if E2E_CLEANUP_AFTER=true)
     
-    Note: This fixture obtains its own JWT token using obtain_jwt_token() rather
-    than depending on the jwt_token fixture. This allows the jwt_token fixture to
-    use function scope while this module-scoped fixture can still operate correctly.
+    Session-scoped so the 3-5 minute pipeline runs once per pytest run, however
+    many modules use it. The yielded context is read-only since it is shared.
+    
+    Note: This fixture takes its upload token from jwt_token_provider right before
+    the upload rather than depending on the jwt_token fixture. This allows the
+    jwt_token fixture to use function scope while this session-scoped fixture can
+    still operate correctly.
+    
+    When iterating on the tests themselves, pass --reuse-cluster-id (or set
+    E2E_REUSE_CLUSTER_ID) to a cluster from an earlier run kept with
+    E2E_CLEANUP_AFTER=false. Setup and teardown are skipped and the tests run
+    against that cluster's existing summary rows.
     
     Environment Variables:
     - E2E_CLEANUP_BEFORE: Run cleanup before tests (default: true)
     - E2E_CLEANUP_AFTER: Run cleanup after tests (default: true)
+    - E2E_REUSE_CLUSTER_ID: Reuse an already processed cluster (default: unset)
     """
+    reuse_cluster_id = request.config.getoption("--reuse-cluster-id")
+    if reuse_cluster_id:
+        yield _reuse_cost_validation_data(cluster_config, reuse_cluster_id, org_id)
+        return
+    
     # Check cleanup settings
     cleanup_before = os.environ.get("E2E_CLEANUP_BEFORE", "true").lower() == "true"
     cleanup_after = os.environ.get("E2E_CLEANUP_AFTER", "true").lower() == "true"
@@ -196,20 +224,30 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
     # Generate unique cluster ID
     cluster_id = generate_cluster_id(prefix="cost-val")
     
-    # Get required pods
-    db_pod = get_pod_by_label(cluster_config.namespace, "app.kubernetes.io/component=database")
+    # Get required pods (two independent oc lookups)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        db_pod_future = executor.submit(
+            get_pod_by_label, cluster_config.namespace, "app.kubernetes.io/component=database"
+        )
+        ingress_pod_future = executor.submit(
+            get_pod_by_label, cluster_config.namespace, "app.kubernetes.io/component=ingress"
+        )
+        db_pod = db_pod_future.result()
+        ingress_pod = ingress_pod_future.result()
+    
     if not db_pod:
         pytest.skip("Database pod not found")
-    
-    ingress_pod = get_pod_by_label(cluster_config.namespace, "app.kubernetes.io/component=ingress")
     if not ingress_pod:
         pytest.skip("Ingress pod not found")
     
     temp_dir = tempfile.mkdtemp(prefix="cost_validation_")
+    # NISE generation only needs the cluster ID, so it runs in the background
+    # while the cluster is cleaned up and the source is registered
+    nise_executor = ThreadPoolExecutor(max_workers=1)
     source_registration = None
     
     # Use Koku API URL (sources are now part of Koku, unified deployment)
-    api_url = get_koku_api_url(cluster_config.helm_release_name, cluster_config.namespace)
+    api_url = cluster_config.koku_api_url
     rh_identity = create_rh_identity_header(org_id)
     
     # Use centralized NISE config
@@ -223,6 +261,16 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
         print(f"  Cleanup before: {cleanup_before}")
         print(f"  Cleanup after: {cleanup_after}")
         
+        # Use 2 days ago to yesterday to get exactly 24 hours of data
+        # (NISE generates from start_date 00:00 to end_date 23:59, so same day = 0 data)
+        now = datetime.utcnow()
+        # Use dates 2-3 days ago to ensure we get exactly 24 hours
+        start_date = (now - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        nise_future = nise_executor.submit(
+            generate_nise_data, cluster_id, start_date, end_date, temp_dir, config=nise_config
+        )
+        
         # Pre-test cleanup: Remove any leftover cost-val clusters from previous runs
         if cleanup_before:
             print("\n  [0/5] Pre-test cleanup...")
@@ -234,20 +282,8 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
         else:
             print("\n  [0/5] Pre-test cleanup SKIPPED (E2E_CLEANUP_BEFORE=false)")
         
-        # Step 1: Generate NISE data
-        # Use 2 days ago to yesterday to get exactly 24 hours of data
-        # (NISE generates from start_date 00:00 to end_date 23:59, so same day = 0 data)
-        print("\n  [1/5] Generating NISE data...")
-        now = datetime.utcnow()
-        # Use dates 2-3 days ago to ensure we get exactly 24 hours
-        start_date = (now - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        end_date = (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        files = generate_nise_data(cluster_id, start_date, end_date, temp_dir, config=nise_config)
-        print(f"       Generated {len(files['all_files'])} CSV files")
-        
-        if not files["all_files"]:
-            pytest.skip("NISE generated no CSV files")
+        # Step 1: Generate NISE data (started above, collected before upload)
+        print("\n  [1/5] Generating NISE data in the background...")
         
         # Step 2: Register source via Koku API
         print("\n  [2/5] Registering source...")
@@ -269,6 +305,12 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
             pytest.fail(f"Provider not created for cluster {cluster_id}")
         print("       Provider created")
         
+        files = nise_future.result()
+        print(f"       Generated {len(files['all_files'])} CSV files")
+        
+        if not files["all_files"]:
+            pytest.skip("NISE generated no CSV files")
+        
         # Step 4: Upload data
         print("\n  [4/5] Uploading data via ingress...")
         
@@ -278,28 +320,24 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
             cluster_id=cluster_id,
             start_date=start_date,
             end_date=end_date,
-            node_label_files=files["node_label_files"] if files["node_label_files"] else None,
-            namespace_label_files=files["namespace_label_files"] if files["namespace_label_files"] else None,
+            node_label_files=files["node_label_files"] or None,
+            namespace_label_files=files["namespace_label_files"] or None,
         )
         
         upload_url = f"{ingress_url}/v1/upload"
         print(f"       Ingress URL: {upload_url}")
         print(f"       Package size: {os.path.getsize(package_path)} bytes")
         
-        # Obtain a fresh JWT token for upload
-        # We need to retrieve a new token here because this test fixture can last over
-        # the 5-minute TTL for Keycloak tokens. This fixture is module-scoped and runs
-        # expensive setup (NISE data generation, source registration, data processing)
-        # that can take 3-5 minutes total, so we generate our own token rather than
-        # depending on the function-scoped jwt_token fixture.
-        upload_token = obtain_jwt_token(keycloak_config)
-        
-        # Create a session with SSL verification disabled
-        session = requests.Session()
-        session.verify = False
+        # Get a JWT token valid for the upload right before using it
+        # This fixture is session-scoped and runs expensive setup (NISE data
+        # generation, source registration, data processing) that can take 3-5
+        # minutes, longer than the 5-minute TTL of Keycloak tokens. The provider
+        # reuses the session's cached token and only asks Keycloak for a new one
+        # when the cached token is close to expiry.
+        upload_token = jwt_token_provider.get()
         
         response = upload_with_retry(
-            session,
+            upload_session(),
             upload_url,
             package_path,
             upload_token.authorization_header,
@@ -315,35 +353,20 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
         
         if not schema_name:
             pytest.fail(f"Timeout waiting for summary tables for cluster {cluster_id}")
+        # The schema is interpolated into queries as an identifier, so only
+        # accept plain tenant schema names
+        if not _SCHEMA_NAME_RE.match(schema_name):
+            pytest.fail(f"Unexpected tenant schema name: {schema_name!r}")
         print("       Summary tables populated")
         
         print(f"\n{'='*60}")
         print("SETUP COMPLETE - Running validation tests")
         print(f"{'='*60}\n")
         
-        # Query the actual number of days of data in the DB
-        # Koku aggregates hourly data into daily summaries
-        result = execute_db_query(
-            cluster_config.namespace, db_pod, "costonprem_koku", "koku",
-            f"""
-            SELECT COUNT(DISTINCT usage_start)
-            FROM {schema_name}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{cluster_id}'
-            """
+        yield _cost_validation_context(
+            cluster_config.namespace, db_pod, cluster_id, schema_name,
+            source_registration.source_id, org_id, nise_config,
         )
-        actual_days = int(result[0][0]) if result and result[0][0] else 1
-        actual_hours = actual_days * 24  # Each day has 24 hours of data
-        print(f"  Actual days of data in DB: {actual_days} ({actual_hours} hours)")
-        
-        yield {
-            "namespace": cluster_config.namespace,
-            "db_pod": db_pod,
-            "cluster_id": cluster_id,
-            "schema_name": schema_name,
-            "source_id": source_registration.source_id,
-            "org_id": org_id,
-            "expected": nise_config.get_expected_values(hours=actual_hours),
-        }
         
     finally:
         # Cleanup (only if enabled)
@@ -352,24 +375,35 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
             print("COST VALIDATION TEST CLEANUP")
             print(f"{'='*60}")
             
-            if source_registration:
-                if delete_source(
-                    cluster_config.namespace,
-                    ingress_pod,
-                    api_url,
-                    rh_identity,
-                    source_registration.source_id,
-                    container="ingress",
-                ):
-                    print(f"  Deleted source {source_registration.source_id}")
-                else:
-                    print(f"  Warning: Could not delete source {source_registration.source_id}")
-            
-            if db_pod:
-                if cleanup_database_records(cluster_config.namespace, db_pod, cluster_id):
-                    print("  Cleaned up database records")
-                else:
-                    print("  Warning: Could not clean database records")
+            # The source API delete and the database cleanup are independent
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                source_future = None
+                if source_registration:
+                    source_future = executor.submit(
+                        delete_source,
+                        cluster_config.namespace,
+                        ingress_pod,
+                        api_url,
+                        rh_identity,
+                        source_registration.source_id,
+                        container="ingress",
+                    )
+                db_future = None
+                if db_pod:
+                    db_future = executor.submit(
+                        cleanup_database_records, cluster_config.namespace, db_pod, cluster_id
+                    )
+                
+                if source_future:
+                    if source_future.result():
+                        print(f"  Deleted source {source_registration.source_id}")
+                    else:
+                        print(f"  Warning: Could not delete source {source_registration.source_id}")
+                if db_future:
+                    if db_future.result():
+                        print("  Cleaned up database records")
+                    else:
+                        print("  Warning: Could not clean database records")
         else:
             print("COST VALIDATION TEST CLEANUP SKIPPED (E2E_CLEANUP_AFTER=false)")
             print(f"{'='*60}")
@@ -377,6 +411,9 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
             if source_registration:
                 print(f"  Source ID: {source_registration.source_id}")
         
+        # NISE may still be writing into temp_dir if setup failed early
+        nise_executor.shutdown(wait=True)
+        
         # Always clean up temp directory (local files only)
         if temp_dir and os.path.exists(temp_dir):
             shutil.rmtree(temp_dir, ignore_errors=True)
@@ -385,3 +422,115 @@ def cost_validation_data(cluster_config, s3_config, keycloak_config, ingress_url
         print(f"{'='*60}\n")
 
 
+def _cost_validation_context(
+    namespace: str,
+    db_pod: str,
+    cluster_id: str,
+    schema_name: str,
+    source_id: Optional[str],
+    org_id: str,
+    nise_config: NISEConfig,
+) -> MappingProxyType:
+    """Build the read-only context yielded by cost_validation_data."""
+    # Query the actual number of days of data in the DB
+    # Koku aggregates hourly data into daily summaries
+    result = execute_db_query(
+        namespace, db_pod, "costonprem_koku", "koku",
+        f"""
+        SELECT COUNT(DISTINCT usage_start)
+        FROM {schema_name}.reporting_ocpusagelineitem_daily_summary
+        WHERE cluster_id = :'cluster_id'
+        """,
+        params={"cluster_id": cluster_id},
+    )
+    actual_days = int(result[0][0]) if result and result[0][0] else 1
+    actual_hours = actual_days * 24  # Each day has 24 hours of data
+    print(f"  Actual days of data in DB: {actual_days} ({actual_hours} hours)")
+    
+    return MappingProxyType({
+        "namespace": namespace,
+        "db_pod": db_pod,
+        "cluster_id": cluster_id,
+        "schema_name": schema_name,
+        "source_id": source_id,
+        "org_id": org_id,
+        "expected": MappingProxyType(nise_config.get_expected_values(hours=actual_hours)),
+    })
+
+
+def _reuse_cost_validation_data(cluster_config, cluster_id: str, org_id: str) -> MappingProxyType:
+    """Build the cost validation context for an already processed cluster.
+    
+    The data must have been generated from the default NISEConfig, as in a
+    previous cost_validation_data run. Nothing is created or cleaned up.
+    """
+    print(f"\n{'='*60}")
+    print("COST VALIDATION TEST SETUP SKIPPED (reusing existing data)")
+    print(f"{'='*60}")
+    print(f"  Cluster ID: {cluster_id}")
+    
+    db_pod = get_pod_by_label(cluster_config.namespace, "app.kubernetes.io/component=database")
+    if not db_pod:
+        pytest.skip("Database pod not found")
+    
+    # Single check: the data is expected to be processed already
+    schema_name = wait_for_summary_tables(
+        cluster_config.namespace, db_pod, cluster_id, timeout=1, interval=1
+    )
+    if not schema_name:
+        pytest.fail(f"No summary data found for reused cluster {cluster_id}")
+    if not _SCHEMA_NAME_RE.match(schema_name):
+        pytest.fail(f"Unexpected tenant schema name: {schema_name!r}")
+    print(f"  Schema: {schema_name}\n")
+    
+    return _cost_validation_context(
+        cluster_config.namespace, db_pod, cluster_id, schema_name,
+        None, org_id, NISEConfig(),
+    )
+
+
+# Aggregates over the test cluster's summary rows, keyed by the name tests use.
+# "allocated" excludes Koku's synthetic unallocated-capacity namespaces.
+_SUMMARY_METRICS = {
+    "row_count": "COUNT(*)",
+    "pod_request_cpu_core_hours": "SUM(pod_request_cpu_core_hours) FILTER (WHERE allocated)",
+    "pod_request_memory_gigabyte_hours": "SUM(pod_request_memory_gigabyte_hours) FILTER (WHERE allocated)",
+    "pod_usage_cpu_core_hours": "SUM(pod_usage_cpu_core_hours) FILTER (WHERE allocated)",
+    "pod_usage_memory_gigabyte_hours": "SUM(pod_usage_memory_gigabyte_hours) FILTER (WHERE allocated)",
+    "node_count": "COUNT(DISTINCT node) FILTER (WHERE allocated)",
+    "namespace_count": "COUNT(DISTINCT namespace) FILTER (WHERE allocated)",
+    "resource_id_count": "COUNT(DISTINCT resource_id) FILTER (WHERE allocated)",
+    "node_name": "MIN(node) FILTER (WHERE allocated)",
+    "namespace_name": "MIN(namespace) FILTER (WHERE allocated)",
+}
+
+
+@pytest.fixture(scope="session")
+def summary_metrics(cost_validation_data) -> MappingProxyType:
+    """Compute every summary-table metric the validation tests check in one query.
+    
+    The tests all aggregate the same rows, so they share a single psql round
+    trip. Values are psql's text output, with None for SQL NULL.
+    """
+    ctx = cost_validation_data
+    select_list = ",\n    ".join(_SUMMARY_METRICS.values())
+    result = execute_db_query(
+        ctx["namespace"], ctx["db_pod"], "costonprem_koku", "koku_user",
+        f"""
+        SELECT
+            {select_list}
+        FROM (
+            SELECT *, namespace NOT LIKE '%unallocated%' AS allocated
+            FROM {ctx["schema_name"]}.reporting_ocpusagelineitem_daily_summary
+            WHERE cluster_id = :'cluster_id'
+        ) rows
+        """,
+        params={"cluster_id": ctx["cluster_id"]},
+    )
+    
+    if not result or len(result[0]) != len(_SUMMARY_METRICS):
+        pytest.fail("Could not query summary table metrics")
+    
+    return MappingProxyType({
+        name: value or None for name, value in zip(_SUMMARY_METRICS, result[0])
+    })
@@ -56,36 +56,19 @@ class TestSummaryTableData:
             ctx["db_pod"],
             "costonprem_koku",
             "koku_user",
-            f"""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = '{ctx["schema_name"]}'
-                AND table_name = 'reporting_ocpusagelineitem_daily_summary'
-            )
-            """,
+            "SELECT to_regclass(:'table') IS NOT NULL",
+            params={"table": f"{ctx['schema_name']}.reporting_ocpusagelineitem_daily_summary"},
         )
         
         assert result and result[0][0] in ["t", "True", True, "1"], (
             f"Summary table not found in schema '{ctx['schema_name']}'."
         )
     
-    def test_summary_has_data_for_cluster(self, cost_validation_data):
+    def test_summary_has_data_for_cluster(self, cost_validation_data, summary_metrics):
         """Verify summary table has data for the test cluster."""
         ctx = cost_validation_data
         
-        result = execute_db_query(
-            ctx["namespace"],
-            ctx["db_pod"],
-            "costonprem_koku",
-            "koku_user",
-            f"""
-            SELECT COUNT(*)
-            FROM {ctx["schema_name"]}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{ctx["cluster_id"]}'
-            """,
-        )
-        
-        row_count = int(result[0][0]) if result else 0
+        row_count = int(summary_metrics["row_count"] or 0)
         
         assert row_count > 0, (
             f"No summary data found for cluster '{ctx['cluster_id']}'."
@@ -110,70 +93,50 @@ class TestMetricValidation:
         ),
     ])
     def test_request_metric_within_tolerance(
-        self, cost_validation_data, metric_name: str, db_column: str, expected_key: str, unit: str
+        self, cost_validation_data, summary_metrics,
+        metric_name: str, db_column: str, expected_key: str, unit: str
     ):
         """Verify request metric matches expected value within tolerance.
         
         Parametrized for: CPU request hours, memory request GB-hours.
         """
         ctx = cost_validation_data
-        expected = ctx["expected"]
+        expected_value = ctx["expected"][expected_key]
         tolerance = get_cost_tolerance()
+        # Accepted range is fixed by the expectation, so compute it up front
+        lower = expected_value * (1 - tolerance)
+        upper = expected_value * (1 + tolerance)
         
-        result = execute_db_query(
-            ctx["namespace"],
-            ctx["db_pod"],
-            "costonprem_koku",
-            "koku_user",
-            f"""
-            SELECT SUM({db_column}) as total
-            FROM {ctx["schema_name"]}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{ctx["cluster_id"]}'
-            AND namespace NOT LIKE '%unallocated%'
-            """,
-        )
+        total = summary_metrics[db_column]
+        assert total is not None, f"No {metric_name} data in summary tables"
         
-        assert result and result[0][0] is not None, f"No {metric_name} data in summary tables"
-        
-        actual_value = float(result[0][0])
-        expected_value = expected[expected_key]
+        actual_value = float(total)
         
-        diff_pct = abs(actual_value - expected_value) / expected_value if expected_value > 0 else 0
-        
-        assert diff_pct <= tolerance, (
+        # The diff percentage is only needed for the failure message, which
+        # assert evaluates lazily
+        assert expected_value <= 0 or lower <= actual_value <= upper, (
             f"{metric_name.capitalize()} mismatch:\n"
             f"  Expected: {expected_value:.2f} {unit}\n"
             f"  Actual:   {actual_value:.2f} {unit}\n"
-            f"  Diff:     {diff_pct*100:.1f}% (tolerance: {tolerance*100}%)"
+            f"  Diff:     {abs(actual_value - expected_value) / expected_value * 100:.1f}% "
+            f"(tolerance: {tolerance*100}%)"
         )
     
     @pytest.mark.parametrize("metric_name,db_column,unit", [
         pytest.param("CPU", "pod_usage_cpu_core_hours", "hours", id="cpu_usage"),
         pytest.param("memory", "pod_usage_memory_gigabyte_hours", "GB-hours", id="memory_usage"),
     ])
-    def test_usage_recorded(self, cost_validation_data, metric_name: str, db_column: str, unit: str):
+    def test_usage_recorded(
+        self, summary_metrics, metric_name: str, db_column: str, unit: str
+    ):
         """Verify usage data was recorded (non-zero).
         
         Parametrized for: CPU usage, memory usage.
         """
-        ctx = cost_validation_data
-        
-        result = execute_db_query(
-            ctx["namespace"],
-            ctx["db_pod"],
-            "costonprem_koku",
-            "koku_user",
-            f"""
-            SELECT SUM({db_column}) as total_usage
-            FROM {ctx["schema_name"]}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{ctx["cluster_id"]}'
-            AND namespace NOT LIKE '%unallocated%'
-            """,
-        )
+        total_usage = summary_metrics[db_column]
+        assert total_usage is not None, f"No {metric_name} usage data"
         
-        assert result and result[0][0] is not None, f"No {metric_name} usage data"
-        
-        actual_usage = float(result[0][0])
+        actual_usage = float(total_usage)
         assert actual_usage > 0, f"{metric_name} usage is zero or negative: {actual_usage} {unit}"
 
 
@@ -188,31 +151,19 @@ class TestResourceCounts:
         pytest.param("pod", "resource_id", "expected_pod_count", id="pod_count"),
     ])
     def test_resource_count_matches_expected(
-        self, cost_validation_data, resource_type: str, db_column: str, expected_key: str
+        self, cost_validation_data, summary_metrics,
+        resource_type: str, db_column: str, expected_key: str
     ):
         """Verify unique resource count matches expected.
         
         Parametrized for: node, namespace, pod counts.
         """
-        ctx = cost_validation_data
-        expected = ctx["expected"]
+        expected = cost_validation_data["expected"]
         
-        result = execute_db_query(
-            ctx["namespace"],
-            ctx["db_pod"],
-            "costonprem_koku",
-            "koku_user",
-            f"""
-            SELECT COUNT(DISTINCT {db_column}) as count
-            FROM {ctx["schema_name"]}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{ctx["cluster_id"]}'
-            AND namespace NOT LIKE '%unallocated%'
-            """,
-        )
-        
-        assert result, f"Could not query {resource_type} count"
+        count = summary_metrics[f"{db_column}_count"]
+        assert count is not None, f"Could not query {resource_type} count"
         
-        actual_count = int(result[0][0])
+        actual_count = int(count)
         expected_count = expected[expected_key]
         
         assert actual_count == expected_count, (
@@ -231,32 +182,18 @@ class TestResourceNames:
         pytest.param("namespace", "namespace", "namespace", id="namespace_name"),
     ])
     def test_resource_name_matches_expected(
-        self, cost_validation_data, resource_type: str, db_column: str, expected_key: str
+        self, cost_validation_data, summary_metrics,
+        resource_type: str, db_column: str, expected_key: str
     ):
         """Verify resource name matches NISE static report.
         
         Parametrized for: node name, namespace name.
         """
-        ctx = cost_validation_data
-        expected = ctx["expected"]
+        expected = cost_validation_data["expected"]
         
-        result = execute_db_query(
-            ctx["namespace"],
-            ctx["db_pod"],
-            "costonprem_koku",
-            "koku_user",
-            f"""
-            SELECT DISTINCT {db_column}
-            FROM {ctx["schema_name"]}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{ctx["cluster_id"]}'
-            AND namespace NOT LIKE '%unallocated%'
-            LIMIT 1
-            """,
-        )
+        actual_value = summary_metrics[f"{db_column}_name"]
+        assert actual_value, f"No {resource_type} data available"
         
-        assert result and result[0][0], f"No {resource_type} data available"
-        
-        actual_value = result[0][0]
         expected_value = expected[expected_key]
         
         assert actual_value == expected_value, (
@@ -271,7 +208,12 @@ class TestInfrastructureCost:
     """Tests for infrastructure cost calculation."""
     
     def test_infrastructure_cost_calculated(self, cost_validation_data):
-        """Verify infrastructure cost was calculated (non-zero)."""
+        """Verify infrastructure cost was calculated (non-zero).
+        
+        The cost is summed as float8 rather than NUMERIC: the value is only
+        checked for sign and printed, so arbitrary-precision parsing of every
+        row's JSONB text is unnecessary.
+        """
         ctx = cost_validation_data
         
         result = execute_db_query(
@@ -282,11 +224,12 @@ class TestInfrastructureCost:
             f"""
             SELECT 
                 COUNT(*) as rows_with_cost,
-                SUM(CAST(infrastructure_usage_cost->>'value' AS NUMERIC)) as total_cost
+                SUM((infrastructure_usage_cost->>'value')::float8) as total_cost
             FROM {ctx["schema_name"]}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{ctx["cluster_id"]}'
+            WHERE cluster_id = :'cluster_id'
             AND infrastructure_usage_cost IS NOT NULL
             """,
+            params={"cluster_id": ctx["cluster_id"]},
         )
         
         assert result, "Could not query infrastructure cost"
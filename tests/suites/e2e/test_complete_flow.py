@@ -35,18 +35,17 @@ from utils import (
     create_upload_package,
     create_upload_package_from_files,
     execute_db_query,
-    get_pod_by_label,
     get_secret_value,
     wait_for_condition,
     run_oc_command,
 )
 from cleanup import full_cleanup
-from e2e_helpers import install_nise
 
 # Import shared E2E helpers
 from e2e_helpers import (
     E2E_CLUSTER_PREFIX,
     DEFAULT_NISE_CONFIG,
+    batch_curl_get,
     is_nise_available,
     install_nise,
     ensure_nise_available,
@@ -60,20 +59,6 @@ from e2e_helpers import (
 # Data Generation Utilities
 # =============================================================================
 
-def is_nise_available() -> bool:
-    """Check if NISE is available for data generation."""
-    try:
-        result = subprocess.run(
-            ["nise", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return result.returncode == 0
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return False
-
-
 def generate_dynamic_static_report(start_date: datetime, end_date: datetime, output_dir: str) -> str:
     """Generate a dynamic NISE static report YAML with current dates.
     
@@ -475,35 +460,33 @@ class TestCompleteDataFlow:
                 verbose=True,
             )
         
-        # Get source type ID from Koku (GET - use reads)
-        result = exec_in_pod(
+        # Fetch source types, application types and existing sources in one
+        # pod exec - the three reads are independent
+        responses = batch_curl_get(
             cluster_config.namespace,
             ingress_pod,
             [
-                "curl", "-s", "-w", "\n__HTTP_CODE__:%{http_code}",
                 f"{koku_api_url}/source_types",
-                "-H", "Content-Type: application/json",
-                "-H", f"X-Rh-Identity: {rh_identity_header}",
+                f"{koku_api_url}/application_types",
+                f"{koku_api_url}/sources",
             ],
+            rh_identity_header,
             container="ingress",
         )
         
-        if not result:
+        if not responses:
             pytest.fail(
                 f"Could not get source types - exec_in_pod returned None. "
                 f"ingress_pod={ingress_pod}, url={koku_api_url}/source_types"
             )
         
-        # Parse response and status code
-        if "__HTTP_CODE__:" in result:
-            body, http_code = result.rsplit("__HTTP_CODE__:", 1)
-            result = body.strip()
-            http_code = http_code.strip()
-            if http_code != "200":
-                pytest.fail(
-                    f"Source types request failed with HTTP {http_code}. "
-                    f"Response: {result[:500]}"
-                )
+        (http_code, result), (_, app_types_result), (_, sources_result) = responses
+        
+        if http_code and http_code != "200":
+            pytest.fail(
+                f"Source types request failed with HTTP {http_code}. "
+                f"Response: {result[:500]}"
+            )
         
         if not result:
             pytest.fail("Source types returned empty response")
@@ -518,19 +501,7 @@ class TestCompleteDataFlow:
         if not ocp_type_id:
             pytest.skip("OpenShift source type not found")
         
-        # Get application type ID from Koku (GET - use reads)
-        result = exec_in_pod(
-            cluster_config.namespace,
-            ingress_pod,
-            [
-                "curl", "-s", f"{koku_api_url}/application_types",
-                "-H", "Content-Type: application/json",
-                "-H", f"X-Rh-Identity: {rh_identity_header}",
-            ],
-            container="ingress",
-        )
-        
-        app_types = json.loads(result)
+        app_types = json.loads(app_types_result)
         cost_mgmt_app_id = None
         for at in app_types.get("data", []):
             if at.get("name") == "/insights/platform/cost-management":
@@ -542,20 +513,9 @@ class TestCompleteDataFlow:
         
         # Check for existing e2e sources and delete them
         print(f"  🔍 Checking for existing e2e sources...")
-        result = exec_in_pod(
-            cluster_config.namespace,
-            ingress_pod,
-            [
-                "curl", "-s", f"{koku_api_url}/sources",
-                "-H", "Content-Type: application/json",
-                "-H", f"X-Rh-Identity: {rh_identity_header}",
-            ],
-            container="ingress",
-        )
-        
-        if result:
+        if sources_result:
             try:
-                existing_sources = json.loads(result)
+                existing_sources = json.loads(sources_result)
                 for existing in existing_sources.get("data", []):
                     existing_name = existing.get("name", "")
                     existing_id = existing.get("id")
@@ -755,10 +715,7 @@ class TestCompleteDataFlow:
 
     def test_02_provider_created_in_koku(self, cluster_config, registered_source):
         """Step 2: Verify provider was created in Koku database via Kafka."""
-        db_pod = get_pod_by_label(
-            cluster_config.namespace,
-            "app.kubernetes.io/component=database"
-        )
+        db_pod = registered_source["db_pod"]
         if not db_pod:
             pytest.skip("Database pod not found")
         
@@ -771,13 +728,15 @@ class TestCompleteDataFlow:
                 "costonprem_koku",
                 "koku_user",
                 f"""
-                SELECT COUNT(*) FROM api_provider p
-                JOIN api_providerauthentication a ON p.authentication_id = a.id
-                WHERE a.credentials->>'cluster_id' = '{cluster_id}'
-                   OR p.additional_context->>'cluster_id' = '{cluster_id}'
+                SELECT EXISTS (
+                    SELECT 1 FROM api_provider p
+                    JOIN api_providerauthentication a ON p.authentication_id = a.id
+                    WHERE a.credentials->>'cluster_id' = '{cluster_id}'
+                       OR p.additional_context->>'cluster_id' = '{cluster_id}'
+                )
                 """,
             )
-            return result is not None and int(result[0][0]) > 0
+            return bool(result) and result[0][0] == "t"
         
         success = wait_for_condition(
             check_provider,
@@ -871,10 +830,7 @@ class TestCompleteDataFlow:
 
     def test_04_manifest_created_in_koku(self, cluster_config, registered_source):
         """Step 4: Verify manifest was created in Koku database."""
-        db_pod = get_pod_by_label(
-            cluster_config.namespace,
-            "app.kubernetes.io/component=database"
-        )
+        db_pod = registered_source["db_pod"]
         if not db_pod:
             pytest.skip("Database pod not found")
         
@@ -887,11 +843,13 @@ class TestCompleteDataFlow:
                 "costonprem_koku",
                 "koku_user",
                 f"""
-                SELECT COUNT(*) FROM reporting_common_costusagereportmanifest
-                WHERE cluster_id = '{cluster_id}'
+                SELECT EXISTS (
+                    SELECT 1 FROM reporting_common_costusagereportmanifest
+                    WHERE cluster_id = '{cluster_id}'
+                )
                 """,
             )
-            return result is not None and int(result[0][0]) > 0
+            return bool(result) and result[0][0] == "t"
         
         success = wait_for_condition(
             check_manifest,
@@ -935,10 +893,7 @@ class TestCompleteDataFlow:
 
     def test_05_files_processed_by_masu(self, cluster_config, registered_source):
         """Step 5: Verify uploaded files were processed by MASU with proper status."""
-        db_pod = get_pod_by_label(
-            cluster_config.namespace,
-            "app.kubernetes.io/component=database"
-        )
+        db_pod = registered_source["db_pod"]
         if not db_pod:
             pytest.skip("Database pod not found")
         
@@ -977,6 +932,8 @@ class TestCompleteDataFlow:
         assert success, "File processing not completed"
         
         # Validate file processing status details (from processing_state tests)
+        # Aggregate in SQL so only one summary row crosses the pod exec,
+        # however many status rows manifest retries have accumulated.
         file_status_result = execute_db_query(
             cluster_config.namespace,
             db_pod,
@@ -984,40 +941,33 @@ class TestCompleteDataFlow:
             "koku_user",
             f"""
             SELECT 
-                s.report_name,
-                s.status,
-                s.failed_status,
-                s.completed_datetime
+                COUNT(*),
+                COUNT(*) FILTER (WHERE s.status = {FILE_STATUS_SUCCESS}),
+                COUNT(*) FILTER (
+                    WHERE s.status = {FILE_STATUS_SUCCESS} AND s.completed_datetime IS NULL
+                ),
+                COUNT(*) FILTER (WHERE s.status = {FILE_STATUS_FAILED}),
+                array_to_string(
+                    (array_agg(s.report_name) FILTER (WHERE s.status = {FILE_STATUS_FAILED}))[1:3],
+                    ', '
+                )
             FROM reporting_common_costusagereportmanifest m
             JOIN reporting_common_costusagereportstatus s ON s.manifest_id = m.id
             WHERE m.cluster_id = '{cluster_id}'
-            ORDER BY m.creation_datetime DESC
             """,
         )
         
-        if file_status_result:
-            failed_files = []
-            missing_completion = []
-            
-            for row in file_status_result:
-                report_name, status, failed_status, completed_datetime = row
-                status_int = int(status) if status is not None else None
-                
-                if status_int == FILE_STATUS_FAILED:
-                    failed_files.append(report_name)
-                elif status_int == FILE_STATUS_SUCCESS and completed_datetime is None:
-                    missing_completion.append(report_name)
+        if file_status_result and int(file_status_result[0][0]) > 0:
+            total, successful, missing_completion, failed, failed_sample = file_status_result[0]
             
             # Log any issues but don't fail (files may still be processing)
-            if failed_files:
-                print(f"  ⚠️  {len(failed_files)} file(s) failed: {failed_files[:3]}")
+            if int(failed):
+                print(f"  ⚠️  {failed} file(s) failed: {failed_sample}")
             
-            if missing_completion:
-                print(f"  ⚠️  {len(missing_completion)} successful file(s) missing completion time")
+            if int(missing_completion):
+                print(f"  ⚠️  {missing_completion} successful file(s) missing completion time")
             
-            # Count successful files
-            successful = sum(1 for row in file_status_result if row[1] and int(row[1]) == FILE_STATUS_SUCCESS)
-            print(f"  ✅ {successful}/{len(file_status_result)} files processed successfully")
+            print(f"  ✅ {successful}/{total} files processed successfully")
 
     @pytest.mark.timeout(900)  # 15 minutes for summary tables
     def test_06_summary_tables_populated(
@@ -1054,10 +1004,7 @@ class TestCompleteDataFlow:
                 "Cannot validate summary tables without proper OCP data format."
             )
         
-        db_pod = get_pod_by_label(
-            cluster_config.namespace,
-            "app.kubernetes.io/component=database"
-        )
+        db_pod = registered_source["db_pod"]
         if not db_pod:
             pytest.skip("Database pod not found")
         
@@ -1181,35 +1128,52 @@ class TestCompleteDataFlow:
                 "date extraction issues in Koku. Direct S3 upload (bash test) may work."
             )
         
-        # Validate processing state (from processing_state tests)
-        # Check for stuck manifests
-        manifest_state = execute_db_query(
+        # Validate processing state (from processing_state tests) and collect
+        # summary stats in one round trip: the aggregate always yields a row,
+        # and the latest manifest is joined onto it when present
+        state_and_stats = execute_db_query(
             cluster_config.namespace,
             db_pod,
             "costonprem_koku",
             "koku_user",
             f"""
             SELECT 
+                s.row_count,
+                s.cpu_hours,
+                s.mem_gb_hours,
                 m.id,
                 m.num_total_files,
                 m.num_processed_files,
                 m.completed_datetime,
                 m.state::text
-            FROM reporting_common_costusagereportmanifest m
-            WHERE m.cluster_id = '{cluster_id}'
-            ORDER BY m.creation_datetime DESC
-            LIMIT 1
+            FROM (
+                SELECT 
+                    COUNT(*) as row_count,
+                    COALESCE(SUM(pod_request_cpu_core_hours), 0) as cpu_hours,
+                    COALESCE(SUM(pod_request_memory_gigabyte_hours), 0) as mem_gb_hours
+                FROM {schema_name}.reporting_ocpusagelineitem_daily_summary
+                WHERE cluster_id = '{cluster_id}'
+            ) s
+            LEFT JOIN LATERAL (
+                SELECT id, num_total_files, num_processed_files, completed_datetime, state
+                FROM reporting_common_costusagereportmanifest
+                WHERE cluster_id = '{cluster_id}'
+                ORDER BY creation_datetime DESC
+                LIMIT 1
+            ) m ON TRUE
             """,
         )
         
-        if manifest_state and manifest_state[0]:
-            manifest = manifest_state[0]
-            manifest_id, total_files, processed_files, completed, state = manifest
+        if state_and_stats and state_and_stats[0]:
+            (
+                row_count, cpu_hours, mem_gb_hours,
+                manifest_id, total_files, processed_files, completed, state,
+            ) = state_and_stats[0]
             
-            # Check if manifest is stuck (has files but none processed and not completed)
-            if total_files and int(total_files) > 0:
+            # Check for stuck manifests (has files but none processed and not completed)
+            if manifest_id and total_files and int(total_files) > 0:
                 processed = int(processed_files) if processed_files else 0
-                if processed == 0 and completed is None:
+                if processed == 0 and not completed:
                     print(f"  ⚠️  Manifest {manifest_id} may be stuck: 0/{total_files} files processed")
                 else:
                     print(f"  ✅ Manifest {manifest_id}: {processed}/{total_files} files processed")
@@ -1217,25 +1181,7 @@ class TestCompleteDataFlow:
             # Check for summary failures in state
             if state and "failed" in state.lower():
                 print(f"  ⚠️  Manifest {manifest_id} has failure in state: {state[:100]}...")
-        
-        # Get summary data stats
-        summary_stats = execute_db_query(
-            cluster_config.namespace,
-            db_pod,
-            "costonprem_koku",
-            "koku_user",
-            f"""
-            SELECT 
-                COUNT(*) as row_count,
-                COALESCE(SUM(pod_request_cpu_core_hours), 0) as cpu_hours,
-                COALESCE(SUM(pod_request_memory_gigabyte_hours), 0) as mem_gb_hours
-            FROM {schema_name}.reporting_ocpusagelineitem_daily_summary
-            WHERE cluster_id = '{cluster_id}'
-            """,
-        )
-        
-        if summary_stats and summary_stats[0]:
-            row_count, cpu_hours, mem_gb_hours = summary_stats[0]
+            
             print(f"  ✅ Summary tables populated: {row_count} rows, {float(cpu_hours):.2f} CPU-hours, {float(mem_gb_hours):.2f} GB-hours")
 
     @pytest.mark.timeout(300)  # 5 minutes for Kruize experiments
@@ -1258,10 +1204,7 @@ class TestCompleteDataFlow:
                 "Simple data format may not contain required fields for ROS processing."
             )
         
-        db_pod = get_pod_by_label(
-            cluster_config.namespace,
-            "app.kubernetes.io/component=database"
-        )
+        db_pod = registered_source["db_pod"]
         if not db_pod:
             pytest.skip("Database pod not found")
         
@@ -1281,12 +1224,14 @@ class TestCompleteDataFlow:
                 "costonprem_kruize",
                 kruize_user,
                 f"""
-                SELECT COUNT(*) FROM kruize_experiments
-                WHERE cluster_name LIKE '%{cluster_id}%'
+                SELECT EXISTS (
+                    SELECT 1 FROM kruize_experiments
+                    WHERE cluster_name LIKE '%{cluster_id}%'
+                )
                 """,
                 password=kruize_password,
             )
-            return result is not None and int(result[0][0]) > 0
+            return bool(result) and result[0][0] == "t"
         
         # Kruize processing takes time - ROS events must flow through
         success = wait_for_condition(
@@ -1349,10 +1294,7 @@ class TestCompleteDataFlow:
                 "Simple data format may not contain sufficient data for Kruize recommendations."
             )
         
-        db_pod = get_pod_by_label(
-            cluster_config.namespace,
-            "app.kubernetes.io/component=database"
-        )
+        db_pod = registered_source["db_pod"]
         if not db_pod:
             pytest.skip("Database pod not found")
         
@@ -1392,12 +1334,14 @@ class TestCompleteDataFlow:
                 "costonprem_kruize",
                 kruize_user,
                 f"""
-                SELECT COUNT(*) FROM kruize_recommendations
-                WHERE cluster_name LIKE '%{cluster_id}%'
+                SELECT EXISTS (
+                    SELECT 1 FROM kruize_recommendations
+                    WHERE cluster_name LIKE '%{cluster_id}%'
+                )
                 """,
                 password=kruize_password,
             )
-            return result is not None and int(result[0][0]) > 0
+            return bool(result) and result[0][0] == "t"
         
         success = wait_for_condition(
             check_recommendations,
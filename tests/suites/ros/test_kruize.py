@@ -67,14 +67,14 @@ class TestKruizeDatabase:
             """
             SELECT table_name FROM information_schema.tables 
             WHERE table_schema = 'public' 
-            AND table_name LIKE 'kruize_%'
+            AND table_name IN ('kruize_experiments', 'kruize_recommendations')
             """,
             password=kruize_credentials["password"],
         )
         
         assert result is not None, "Could not query Kruize tables"
-        tables = [row[0] for row in result]
+        tables = {row[0] for row in result}
         
         # Check for essential tables
-        assert any("experiment" in t for t in tables), "Kruize experiments table not found"
-        assert any("recommendation" in t for t in tables), "Kruize recommendations table not found"
+        assert "kruize_experiments" in tables, "Kruize experiments table not found"
+        assert "kruize_recommendations" in tables, "Kruize recommendations table not found"
@@ -14,7 +14,7 @@ from typing import Any, Dict, Generator, Optional
 
 import pytest
 
-from e2e_helpers import get_koku_api_url, get_source_type_id
+from e2e_helpers import get_source_type_id
 from utils import (
     create_identity_header_custom,
     create_rh_identity_header,
@@ -26,7 +26,7 @@ from utils import (
 @pytest.fixture(scope="module")
 def koku_api_url(cluster_config) -> str:
     """Get Koku API URL for all operations (unified deployment)."""
-    return get_koku_api_url(cluster_config.helm_release_name, cluster_config.namespace)
+    return cluster_config.koku_api_url
 
 
 @pytest.fixture(scope="module")
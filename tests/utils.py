@@ -5,15 +5,27 @@ These are helper functions that can be imported by test modules across all suite
 """
 
 import base64
+import functools
+import io
 import json
 import subprocess
 import tarfile
 import tempfile
+import threading
+import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    from kubernetes import client as k8s_client
+    from kubernetes import config as k8s_config
+    from kubernetes.stream import stream as k8s_stream
+    KUBERNETES_AVAILABLE = True
+except ImportError:
+    KUBERNETES_AVAILABLE = False
+
 
 # =============================================================================
 # Kubernetes/OpenShift Commands
@@ -45,35 +57,55 @@ def run_oc_command(
     )
 
 
-def get_route_url(namespace: str, route_name: str) -> Optional[str]:
-    """Get the URL for an OpenShift route."""
-    try:
-        result = run_oc_command(
-            ["get", "route", route_name, "-n", namespace, "-o", "jsonpath={.spec.host}"]
-        )
-        host = result.stdout.strip()
-        if not host:
-            return None
+# Route URLs per namespace, filled by one `oc get routes` call
+_ROUTE_URLS: dict[str, dict[str, str]] = {}
 
-        # Check if TLS is enabled
-        tls_result = run_oc_command(
-            [
-                "get",
-                "route",
-                route_name,
-                "-n",
-                namespace,
-                "-o",
-                "jsonpath={.spec.tls.termination}",
-            ],
-            check=False,
-        )
-        tls = tls_result.stdout.strip()
+# Namespaces re-listed after a route lookup miss
+_ROUTES_REFRESHED: set[str] = set()
 
-        scheme = "https" if tls else "http"
-        return f"{scheme}://{host}"
-    except subprocess.CalledProcessError:
-        return None
+
+def get_routes(namespace: str, refresh: bool = False) -> dict[str, str]:
+    """Get the URLs of all OpenShift routes in a namespace.
+    
+    The listing is fetched once per namespace and cached for the session.
+    
+    Args:
+        namespace: Namespace to list routes in
+        refresh: Re-query the cluster instead of using the cache
+    
+    Returns:
+        Dict mapping route name to URL (https when TLS termination is set)
+    """
+    if refresh or namespace not in _ROUTE_URLS:
+        try:
+            result = run_oc_command(["get", "routes", "-n", namespace, "-o", "json"])
+            items = json.loads(result.stdout).get("items", [])
+        except (subprocess.CalledProcessError, json.JSONDecodeError):
+            return {}
+        
+        routes = {}
+        for item in items:
+            spec = item.get("spec", {})
+            host = spec.get("host")
+            if not host:
+                continue
+            scheme = "https" if spec.get("tls", {}).get("termination") else "http"
+            routes[item["metadata"]["name"]] = f"{scheme}://{host}"
+        _ROUTE_URLS[namespace] = routes
+    
+    return _ROUTE_URLS[namespace]
+
+
+def get_route_url(namespace: str, route_name: str) -> Optional[str]:
+    """Get the URL for an OpenShift route."""
+    url = get_routes(namespace).get(route_name)
+    if url is None and namespace not in _ROUTES_REFRESHED:
+        # The route may have been created after the namespace was cached.
+        # Re-list only once per namespace, so probing for optional routes
+        # that aren't deployed doesn't re-query on every call.
+        _ROUTES_REFRESHED.add(namespace)
+        url = get_routes(namespace, refresh=True).get(route_name)
+    return url
 
 
 def get_secret_value(namespace: str, secret_name: str, key: str) -> Optional[str]:
@@ -98,8 +130,26 @@ def get_secret_value(namespace: str, secret_name: str, key: str) -> Optional[str
         return None
 
 
-def get_pod_by_label(namespace: str, label: str) -> Optional[str]:
-    """Get the first pod name matching a label selector."""
+# Pod names per (namespace, label selector), filled by get_pod_by_label
+_POD_NAMES: dict[tuple[str, str], str] = {}
+
+
+def get_pod_by_label(namespace: str, label: str, refresh: bool = False) -> Optional[str]:
+    """Get the first pod name matching a label selector.
+    
+    Found names are cached for the session, since pods are rarely replaced
+    mid-run; code that deletes pods calls forget_pod() for their selector,
+    and a failed exec_in_pod drops the cached name it used.
+    
+    Args:
+        namespace: Namespace to look in
+        label: Label selector
+        refresh: Re-query the cluster instead of using the cache
+    """
+    key = (namespace, label)
+    if not refresh and key in _POD_NAMES:
+        return _POD_NAMES[key]
+    
     try:
         result = run_oc_command([
             "get", "pods", "-n", namespace,
@@ -107,9 +157,115 @@ def get_pod_by_label(namespace: str, label: str) -> Optional[str]:
             "-o", "jsonpath={.items[0].metadata.name}"
         ], check=False)
         pod_name = result.stdout.strip()
-        return pod_name if pod_name else None
     except subprocess.CalledProcessError:
+        pod_name = ""
+    
+    if not pod_name:
+        _POD_NAMES.pop(key, None)
         return None
+    _POD_NAMES[key] = pod_name
+    return pod_name
+
+
+def forget_pod(namespace: str, label: str) -> None:
+    """Drop the cached pod name for a selector, e.g. before deleting its pods."""
+    _POD_NAMES.pop((namespace, label), None)
+
+
+def _forget_pod_name(namespace: str, pod_name: str) -> None:
+    """Drop every cached selector that resolved to pod_name."""
+    for key, name in list(_POD_NAMES.items()):
+        if key[0] == namespace and name == pod_name:
+            _POD_NAMES.pop(key, None)
+
+
+# Kubernetes API client for REST calls, created on first use; False once
+# loading the kubeconfig has failed, so it is only attempted once
+_CORE_V1 = None
+
+# Per-thread clients for exec streams, see _exec_core_v1()
+_EXEC_CLIENTS = threading.local()
+
+
+def get_core_v1():
+    """Get a shared Kubernetes CoreV1Api client for REST calls.
+    
+    Returns:
+        CoreV1Api built from the current kubeconfig, or None if the
+        kubernetes package or a usable kubeconfig is missing
+    """
+    global _CORE_V1
+    if _CORE_V1 is None:
+        _CORE_V1 = False
+        if KUBERNETES_AVAILABLE:
+            try:
+                k8s_config.load_kube_config()
+                _CORE_V1 = k8s_client.CoreV1Api()
+            except k8s_config.ConfigException:
+                pass
+    return _CORE_V1 or None
+
+
+def _exec_core_v1():
+    """Get this thread's CoreV1Api client for exec streams.
+    
+    kubernetes.stream.stream() swaps the request method of the client it is
+    given while it connects, so exec calls on different threads must not
+    share a client, with each other or with the REST client.
+    """
+    core = getattr(_EXEC_CLIENTS, "core", None)
+    if core is None:
+        core = k8s_client.CoreV1Api(k8s_client.ApiClient())
+        _EXEC_CLIENTS.core = core
+    return core
+
+
+def _open_exec_stream(
+    core,
+    namespace: str,
+    pod_name: str,
+    command: list[str],
+    container: Optional[str],
+):
+    """Start a command in a pod through the Kubernetes API exec stream."""
+    kwargs = {"container": container} if container else {}
+    return k8s_stream(
+        core.connect_get_namespaced_pod_exec,
+        pod_name,
+        namespace,
+        command=command,
+        stderr=True,
+        stdin=False,
+        stdout=True,
+        tty=False,
+        _preload_content=False,
+        **kwargs,
+    )
+
+
+def _read_exec_stream(resp, command: list[str], timeout: int) -> subprocess.CompletedProcess:
+    """Collect an exec stream's output and exit code.
+    
+    Returns the same CompletedProcess shape as the `oc exec` path and raises
+    subprocess.TimeoutExpired when the command outlives timeout.
+    """
+    stdout = []
+    stderr = []
+    deadline = time.monotonic() + timeout
+    try:
+        while resp.is_open():
+            if time.monotonic() > deadline:
+                raise subprocess.TimeoutExpired(command, timeout)
+            resp.update(timeout=1)
+            if resp.peek_stdout():
+                stdout.append(resp.read_stdout())
+            if resp.peek_stderr():
+                stderr.append(resp.read_stderr())
+        returncode = resp.returncode
+    finally:
+        resp.close()
+    
+    return subprocess.CompletedProcess(command, returncode, "".join(stdout), "".join(stderr))
 
 
 def exec_in_pod(
@@ -119,18 +275,54 @@ def exec_in_pod(
     container: Optional[str] = None,
     timeout: int = 60,
 ) -> Optional[str]:
-    """Execute a command in a pod and return stdout."""
-    try:
-        args = ["exec", "-n", namespace, pod_name]
-        if container:
-            args.extend(["-c", container])
-        args.append("--")
-        args.extend(command)
-        
-        result = run_oc_command(args, check=False, timeout=timeout)
-        return result.stdout if result.returncode == 0 else None
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+    """Execute a command in a pod and return stdout.
+    
+    Uses the Kubernetes API exec stream when the kubernetes package is
+    installed, falling back to `oc exec` when the package or a kubeconfig is
+    missing, or when the stream cannot be opened (e.g. no pods/exec
+    permission, pod not found, websocket handshake or proxy errors).
+    
+    Returns:
+        Command stdout, or None if the exec or the command failed
+    """
+    result = None
+    if get_core_v1() is not None:
+        try:
+            resp = _open_exec_stream(_exec_core_v1(), namespace, pod_name, command, container)
+        except Exception as e:
+            # The command never started, so oc exec can safely run it
+            print(f"  Warning: API exec in {namespace}/{pod_name} failed, using oc exec: {e}")
+        else:
+            try:
+                result = _read_exec_stream(resp, command, timeout)
+            except subprocess.TimeoutExpired:
+                return None
+            except Exception as e:
+                # The command may already have run; running it again through
+                # oc exec could repeat a POST or DELETE
+                print(f"  Warning: API exec in {namespace}/{pod_name} failed: {e}")
+                _forget_pod_name(namespace, pod_name)
+                return None
+    
+    if result is None:
+        try:
+            args = ["exec", "-n", namespace, pod_name]
+            if container:
+                args.extend(["-c", container])
+            args.append("--")
+            args.extend(command)
+            
+            result = run_oc_command(args, check=False, timeout=timeout)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return None
+    
+    if result.returncode != 0:
+        if result.stderr:
+            print(f"  Warning: exec in {namespace}/{pod_name} failed: {result.stderr.strip()[:200]}")
+        # The pod may have been replaced; make the next lookup re-query
+        _forget_pod_name(namespace, pod_name)
         return None
+    return result.stdout
 
 
 # =============================================================================
@@ -138,6 +330,11 @@ def exec_in_pod(
 # =============================================================================
 
 
+# Feeds the query (argument $1) to psql on stdin: psql only interpolates
+# variables in script input, not in -c
+_PSQL_STDIN_SCRIPT = 'query=$1; shift; printf "%s" "$query" | psql "$@"'
+
+
 def execute_db_query(
     namespace: str,
     pod_name: str,
@@ -145,18 +342,29 @@ def execute_db_query(
     user: str,
     query: str,
     password: Optional[str] = None,
+    params: Optional[dict] = None,
 ) -> Optional[list[tuple]]:
-    """Execute a SQL query via kubectl exec and return results."""
+    """Execute a SQL query via kubectl exec and return results.
+    
+    Values in params are bound as psql variables, so :'name' in the query
+    becomes a quoted literal and :"name" a quoted identifier, quoted by psql
+    itself as in cleanup.py.
+    """
     try:
         env_prefix = []
         if password:
             env_prefix = ["env", f"PGPASSWORD={password}"]
         
-        cmd = env_prefix + [
-            "psql", "-U", user, "-d", database,
+        psql_args = [
+            "-X", "-U", user, "-d", database,
             "-t", "-A", "-F", "|",
-            "-c", query
+            "-v", "ON_ERROR_STOP=1",
         ]
+        for name, value in (params or {}).items():
+            psql_args.extend(["-v", f"{name}={value}"])
+        psql_args.extend(["-f", "-"])
+        
+        cmd = env_prefix + ["sh", "-c", _PSQL_STDIN_SCRIPT, "sh", query] + psql_args
         
         result = exec_in_pod(namespace, pod_name, cmd, timeout=120)
         if not result:
@@ -268,6 +476,23 @@ def create_identity_header_custom(
     return base64.b64encode(json.dumps(identity_json).encode()).decode()
 
 
+@functools.lru_cache(maxsize=64)
+def decode_jwt_payload(token: str) -> dict:
+    """Decode the payload segment of a JWT without verifying its signature.
+
+    Results are cached per token, so callers must not mutate the returned dict.
+
+    Args:
+        token: Encoded JWT (header.payload.signature)
+
+    Returns:
+        Decoded payload claims
+    """
+    payload_b64 = token.split(".")[1]
+    payload_b64 += "=" * (-len(payload_b64) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload_b64))
+
+
 def check_service_exists(namespace: str, service_name: str) -> bool:
     """Check if Kubernetes service exists using oc get.
 
@@ -313,6 +538,14 @@ def check_deployment_exists(namespace: str, deployment_name: str) -> bool:
 # =============================================================================
 
 
+def _add_bytes_to_tar(tar: tarfile.TarFile, arcname: str, data: bytes) -> None:
+    """Add an in-memory file to a tar archive."""
+    info = tarfile.TarInfo(arcname)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+
 def create_upload_package(
     csv_data: str,
     cluster_id: str,
@@ -337,13 +570,8 @@ def create_upload_package(
     from datetime import timedelta
     
     temp_dir = tempfile.mkdtemp()
-    csv_file = Path(temp_dir) / "openshift_usage_report.csv"
-    manifest_file = Path(temp_dir) / "manifest.json"
     tar_file = Path(temp_dir) / "cost-mgmt.tar.gz"
 
-    # Write CSV
-    csv_file.write_text(csv_data)
-
     # Calculate date range if not provided
     now = datetime.now(timezone.utc)
     if start_date is None:
@@ -374,12 +602,11 @@ def create_upload_package(
         "start": start_date.isoformat(),
         "end": end_date.isoformat(),
     }
-    manifest_file.write_text(json.dumps(manifest, indent=2))
 
-    # Create tar.gz
+    # Create tar.gz, writing both members straight from memory
     with tarfile.open(tar_file, "w:gz") as tar:
-        tar.add(csv_file, arcname="openshift_usage_report.csv")
-        tar.add(manifest_file, arcname="manifest.json")
+        _add_bytes_to_tar(tar, "openshift_usage_report.csv", csv_data.encode())
+        _add_bytes_to_tar(tar, "manifest.json", json.dumps(manifest, indent=2).encode())
 
     return str(tar_file)
 
@@ -414,7 +641,6 @@ def create_upload_package_from_files(
     import os
     
     temp_dir = tempfile.mkdtemp()
-    manifest_file = Path(temp_dir) / "manifest.json"
     tar_file = Path(temp_dir) / "cost-mgmt.tar.gz"
 
     # Calculate date range if not provided
@@ -454,9 +680,9 @@ def create_upload_package_from_files(
         "start": start_date.isoformat(),
         "end": end_date.isoformat(),
     }
-    manifest_file.write_text(json.dumps(manifest, indent=2))
 
-    # Create tar.gz with all files
+    # Create tar.gz with all files; the CSVs are read straight from NISE's
+    # output and the manifest is written from memory
     with tarfile.open(tar_file, "w:gz") as tar:
         # Add pod usage files
         for filepath in pod_usage_files:
@@ -473,7 +699,7 @@ def create_upload_package_from_files(
             for filepath in namespace_label_files:
                 tar.add(filepath, arcname=os.path.basename(filepath))
         # Add manifest
-        tar.add(manifest_file, arcname="manifest.json")
+        _add_bytes_to_tar(tar, "manifest.json", json.dumps(manifest, indent=2).encode())
 
     return str(tar_file)
 
@@ -547,7 +773,7 @@ def helm_template(
 
 def check_pod_exists(namespace: str, label: str) -> bool:
     """Check if a pod with the given label exists."""
-    return get_pod_by_label(namespace, label) is not None
+    return get_pod_by_label(namespace, label, refresh=True) is not None
 
 
 def check_pod_ready(namespace: str, label: str) -> bool: